@@ -50,14 +50,20 @@ class JobStarter:
     to start jobs and wait for their completion. It also includes a method to set the maximum
     number of cores available for the jobs.
 
+    Attributes
+    ----------
+    streams_cmds : bool
+        Class attribute. If True, `start` accepts any iterable of commands (e.g. a generator) and consumes it lazily.
+        If False (default), runners pass `cmds` as a list, so custom jobstarters can rely on `len(cmds)` and indexing.
+
     Methods
     -------
     __init__(max_cores: int = None)
         Initializes the JobStarter with an optional maximum number of cores.
     
     start(cmds: list, jobname: str, wait: bool, output_path: str) -> None
-        Submits a list of commands as jobs to the scheduling system. This method should be
-        implemented by subclasses.
+        Submits a list of commands (any iterable of commands if `streams_cmds` is True) as jobs to the
+        scheduling system. This method should be implemented by subclasses.
     
     wait_for_job(jobname: str, interval: float) -> None
         Waits for a job to complete before proceeding. This method should be implemented
@@ -95,6 +101,9 @@ class JobStarter:
                 pass
 
     """
+    # runners only pass lazy iterables of commands to jobstarters that opt in
+    streams_cmds = False
+
     def __init__(self, max_cores: int = None):
         """
         Initializes the JobStarter with an optional maximum number of cores.
@@ -113,7 +122,8 @@ class JobStarter:
         Parameters
         ----------
         cmds : list
-            A list of commands to be submitted as jobs.
+            A list of commands to be submitted as jobs. Jobstarters that set `streams_cmds = True` must also accept
+            any other iterable of commands (e.g. a generator), which can only be consumed once.
         jobname : str
             The name of the job.
         wait : bool
@@ -209,6 +219,8 @@ class SbatchArrayJobstarter(JobStarter):
         >>> job_starter = SbatchArrayJobstarter(max_cores=50, remove_cmdfile=True, options="--time=10:00", gpus=True)
         >>> job_starter.start(cmds=["echo 'Hello World!'"], jobname="test_job", wait=True, output_path="/path/to/output")
     """
+    streams_cmds = True
+
     def __init__(self, max_cores: int = 100, remove_cmdfile: bool = False, options: str = None, gpus: bool = False):
         """
         Initializes the SbatchArrayJobstarter with optional parameters.
@@ -243,7 +255,7 @@ class SbatchArrayJobstarter(JobStarter):
         Parameters
         ----------
         cmds : list
-            List of commands to be executed as part of the job array.
+            List of commands to be executed as part of the job array. Other iterables (e.g. generators) are consumed in chunks of at most slurm_max_arrayjobs commands.
         jobname : str
             Name of the job.
         wait : bool, optional
@@ -256,6 +268,13 @@ class SbatchArrayJobstarter(JobStarter):
         RuntimeError
             If the SLURM submission fails.
         """
+        # consume iterables in chunks so that commands never have to be materialized all at once
+        if not isinstance(cmds, list):
+            cmds_iter = iter(cmds)
+            while (sublist := list(itertools.islice(cmds_iter, self.slurm_max_arrayjobs))):
+                self.start(cmds=sublist, jobname=jobname, wait=wait, output_path=output_path)
+            return None
+
         # check if cmds is smaller than 1000. If yes, split cmds and start split array!
         if len(cmds) > self.slurm_max_arrayjobs:
             print(f"The commands-list you supplied is longer than self.slurm_max_arrayjobs. Your job will be subdivided into multiple arrays.")
@@ -380,6 +399,8 @@ class LocalJobStarter(JobStarter):
         >>> job_starter = LocalJobStarter(max_cores=2)
         >>> job_starter.start(cmds=["echo 'Hello World!'"], jobname="test_job", wait=True, output_path="/path/to/output")
     """
+    streams_cmds = True
+
     def __init__(self, max_cores:int=1):
         """
         Initializes the LocalJobStarter with an optional parameter for maximum cores.
@@ -399,7 +420,9 @@ class LocalJobStarter(JobStarter):
         Parameters
         ----------
         cmds : list
-            List of commands to be executed locally.
+            List (or other iterable, e.g. a generator) of commands to be executed locally. Commands are consumed one at a time.
+            Commands are written to the cmdfile with normal buffering as they are started. The cmdfile is complete once all
+            commands have been started; if starting a command fails midway, it lists at most the commands started so far.
         jobname : str
             Name of the job.
         wait : bool, optional
@@ -433,31 +456,26 @@ class LocalJobStarter(JobStarter):
         # collect environment context
         env = os.environ.copy()
 
-        # write cmds to file:
-        cmdfile_path = f"{output_path}/{jobname}_cmds.txt"
-        with open(cmdfile_path, 'w', encoding='UTF-8') as f:
-            f.write("\n".join(cmds)+"\n")
-
-        # invert cmds to start from the top with .pop()
-        cmds = cmds[::-1]
-
         # initialize job loop
         active_processes = []
-        i = 0
 
-        while len(cmds) >= 1:
-            # first check if any processes need to be removed
-            while len(active_processes) >= self.max_cores:
-                update_active_processes(active_processes)
-                time.sleep(1) # avoid busy waiting
+        # write each cmd to the cmdfile as it is started, so cmds can be streamed from a generator.
+        # writes are buffered, the file is closed (and complete) once all cmds are started, before waiting for the processes.
+        cmdfile_path = f"{output_path}/{jobname}_cmds.txt"
+        with open(cmdfile_path, 'w', encoding='UTF-8') as f:
+            for i, cmd in enumerate(cmds, start=1):
+                f.write(cmd + "\n")
+
+                # first check if any processes need to be removed
+                while len(active_processes) >= self.max_cores:
+                    update_active_processes(active_processes)
+                    time.sleep(1) # avoid busy waiting
 
-            # setup process:
-            cmd = cmds.pop()
-            i += 1
-            output_file = f"{output_path}/process_{str(i)}.log"
+                # setup process:
+                output_file = f"{output_path}/process_{str(i)}.log"
 
-            # start
-            active_processes.append(start_process(cmd, output_file))
+                # start
+                active_processes.append(start_process(cmd, output_file))
 
         # wait for completion loop
         while len(active_processes) != 0:
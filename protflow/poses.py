@@ -69,30 +69,71 @@ Version
 """
 
 import os
+import fnmatch
 from glob import glob
 import re
 from typing import Union
 import shutil
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 # dependencies
+import numpy as np
 import pandas as pd
-import Bio.PDB
+import pyarrow as pa
 
 # customs
 from protflow import jobstarters
 from protflow.jobstarters import JobStarter
 from protflow.residues import ResidueSelection
 from protflow.utils.utils import parse_fasta_to_dict
-from protflow.utils.biopython_tools import load_structure_from_pdbfile, get_sequence_from_pose
 import protflow.utils.plotting as plots
 
+# errors raised by pyarrow for object columns it cannot infer a type for (e.g. ResidueSelection objects)
+ARROW_CONVERSION_ERRORS = (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError)
+
+def _save_pickle_fallback(df: pd.DataFrame, path: str, error: Exception) -> None:
+    '''Pickles df to path if pyarrow cannot store it. Nothing is converted, so no data is lost; get_format() loaders read the pickle back.'''
+    logging.warning(f"DataFrame cannot be stored by pyarrow ({error}). Saving it losslessly as pickle at {path} instead.")
+    df.to_pickle(path, compression=None)
+
+def _is_pickle(path: str) -> bool:
+    '''Checks if path holds a pickle (protocol >= 2 starts with the PROTO opcode) instead of a feather/parquet file.'''
+    with open(path, "rb") as f:
+        return f.read(1) == b"\x80"
+
+def _save_feather(df: pd.DataFrame, path: str) -> None:
+    '''Saves DataFrame as zstd-compressed feather file (pickle fallback if pyarrow cannot store all columns).'''
+    try:
+        df.to_feather(path, compression="zstd")
+    except ARROW_CONVERSION_ERRORS as e:
+        _save_pickle_fallback(df, path, e)
+
+def _save_parquet(df: pd.DataFrame, path: str) -> None:
+    '''Saves DataFrame as zstd-compressed parquet file (pickle fallback if pyarrow cannot store all columns).'''
+    try:
+        df.to_parquet(path, compression="zstd")
+    except ARROW_CONVERSION_ERRORS as e:
+        _save_pickle_fallback(df, path, e)
+
+def _read_feather(path: str) -> pd.DataFrame:
+    '''Reads a file written by _save_feather.'''
+    return pd.read_pickle(path, compression=None) if _is_pickle(path) else pd.read_feather(path)
+
+def _read_parquet(path: str) -> pd.DataFrame:
+    '''Reads a file written by _save_parquet.'''
+    return pd.read_pickle(path, compression=None) if _is_pickle(path) else pd.read_parquet(path)
+
+# pyarrow-backed strings for the mandatory poses columns: smaller than python str objects and faster string comparisons
+POSES_STRING_DTYPE = "string[pyarrow]"
+
+# save functions are module-level (not lambdas) so that Poses objects caching them stay picklable
 FORMAT_STORAGE_DICT = {
-    "json": "to_json",
-    "csv": "to_csv",
-    "pickle": "to_pickle",
-    "feather": "to_feather",
-    "parquet": "to_parquet"
+    "json": pd.DataFrame.to_json,
+    "csv": pd.DataFrame.to_csv,
+    "pickle": pd.DataFrame.to_pickle,
+    "feather": _save_feather,
+    "parquet": _save_parquet
 }
 
 class Poses:
@@ -171,7 +212,7 @@ class Poses:
     0.1.0
     """
     ############################################# SETUP #########################################
-    def __init__(self, poses: list = None, work_dir: str = None, storage_format: str = "json", glob_suffix: str = None, jobstarter: JobStarter = jobstarters.SbatchArrayJobstarter()):
+    def __init__(self, poses: list = None, work_dir: str = None, storage_format: str = "feather", glob_suffix: str = None, jobstarter: JobStarter = jobstarters.SbatchArrayJobstarter()):
         """
         Initializes the Poses class with optional parameters for poses, working directory, storage format, glob suffix, and job starter.
 
@@ -182,7 +223,7 @@ class Poses:
         work_dir : str, optional
             The working directory where intermediate and final results will be stored. If not provided, the current directory is used.
         storage_format : str, optional
-            The format used for storing protein data (default is 'json'). Supported formats include 'json', 'csv', 'pickle', 'feather', and 'parquet'.
+            The format used for storing protein data (default is 'feather'). Supported formats include 'json', 'csv', 'pickle', 'feather', and 'parquet'. DataFrames with columns that pyarrow cannot store (e.g. ResidueSelection objects) are saved losslessly as pickle at the feather/parquet path and are read back transparently.
         glob_suffix : str, optional
             A suffix used for globbing multiple files. This allows for batch processing of files matching the given pattern.
         jobstarter : JobStarter, optional
@@ -228,12 +269,24 @@ class Poses:
         self.motifs = []
 
     def __iter__(self):
-        for _, row in self.df.iterrows():
-            yield row
+        # yield rows as dicts (column -> value): keeps keyed access (pose["poses"]) without building a pd.Series per row
+        columns = self.df.columns.to_list()
+        for row in self.df.itertuples(index=False, name=None):
+            yield dict(zip(columns, row))
 
     def __len__(self):
         return len(self.df)
 
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame) -> None:
+        # reassigning the DataFrame invalidates the description -> pose lookup used by get_pose()
+        self._df = df
+        self._desc_index = None
+
     ############################################# SETUP METHODS #########################################
     def set_scorefile(self, work_dir: str) -> None:
         """
@@ -310,6 +363,10 @@ class Poses:
             raise KeyError(f"Format {storage_format} not available. Format must be on of {[list(FORMAT_STORAGE_DICT)]}")
         self.storage_format = storage_format # removed .lower() maybe there is a storage format that needs caps letters.
 
+        # cache save method and file suffix so that save_scores() does not look them up on every call
+        self._save_method = FORMAT_STORAGE_DICT[storage_format.lower()]
+        self._format_suffix = f".{storage_format}"
+
     def set_work_dir(self, work_dir: str, set_scorefile: bool = True) -> None:
         """
         Sets up and configures the working directory for storing data and results.
@@ -510,24 +567,19 @@ class Poses:
             # just change the name of the directory in the poses_df, don't copy the poses anywhere
             if not os.path.isdir(poses_dir):
                 raise ValueError(f":work_dir: has to be existing directory!")
-            if not all((os.path.isfile(pose) for pose in new_poses)):
+            if len(_scan_existing_files(new_poses)) != len(set(new_poses)):
                 raise ValueError(f"Poses do not exist at specified directory. If you want to copy the poses there, set the parameter :copy: to True!")
 
         else:
             # actually copy the poses to a new directory (for whatever reason)
             if not os.path.isdir(poses_dir):
                 os.makedirs(poses_dir)
-            if overwrite:
-                for old_path, new_path in zip(self.poses_list(), new_poses):
-                    shutil.copy(old_path, new_path)
-            else:
-                # if overwrite is False, check if the file exists first. This should save read/write speed.
-                for old_path, new_path in zip(self.poses_list(), new_poses):
-                    if not os.path.isfile(new_path):
-                        shutil.copy(old_path, new_path)
+            # if overwrite is False, poses that already exist are skipped. This should save read/write speed.
+            _parallel_copy(zip(self.poses_list(), new_poses), overwrite=overwrite)
 
         # change path in self.df["poses"] column
-        self.df["poses"] = new_poses
+        self.df["poses"] = pd.array(new_poses, dtype=POSES_STRING_DTYPE)
+        self._desc_index = None
         return self
 
     def parse_poses(self, poses: Union[list,str] = None, glob_suffix: str = None) -> list:
@@ -570,7 +622,7 @@ class Poses:
 
         """
         if isinstance(poses, str) and glob_suffix:
-            parsed_poses = glob(f"{poses}/{glob_suffix}")
+            parsed_poses = scan_dir(poses, glob_suffix)
             if not parsed_poses:
                 raise FileNotFoundError(f"No {glob_suffix} files were found in {poses}. Did you mean to glob? Was the path correct?")
             return parsed_poses
@@ -579,8 +631,9 @@ class Poses:
                 raise FileNotFoundError(f"File {poses} not found!")
             return [poses]
         if isinstance(poses, list):
-            if not all((os.path.isfile(path) for path in poses)):
-                raise FileNotFoundError(f"Not all files listed in poses were found.")
+            # one os.scandir() per parent directory instead of one stat() per pose
+            if (missing := set(poses) - _scan_existing_files(poses)):
+                raise FileNotFoundError(f"Not all files listed in poses were found. Missing files: {sorted(missing)}")
             return poses
         if poses is None:
             return []
@@ -622,7 +675,8 @@ class Poses:
         - Ensures that descriptions are derived in a consistent format, suitable for use in data management and analysis.
 
         """
-        return [pose.strip("/").rsplit("/", maxsplit=1)[-1].split(".", maxsplit=1)[0]for pose in poses]
+        # vectorized string operations: filename without directory and extension
+        return pd.Series(poses, dtype=object).str.strip("/").str.rsplit("/", n=1).str[-1].str.split(".", n=1).str[0].to_list()
 
     def set_poses(self, poses: Union[list,str,pd.DataFrame] = None, glob_suffix: str = None) -> None:
         """
@@ -677,14 +731,9 @@ class Poses:
         poses = self.parse_poses(poses, glob_suffix=glob_suffix)
 
         # handle multiline .fa inputs for poses!
-        for pose in poses:
-            if not pose.endswith(".fa") and not pose.endswith(".fasta"):
-                continue
-            if len(parse_fasta_to_dict(pose)) > 1:
-                poses.remove(pose)
-                poses += self.split_multiline_fasta(pose)
+        poses = self.expand_multiline_fastas(poses)
 
-        self.df = pd.DataFrame({"input_poses": poses, "poses": poses, "poses_description": self.parse_descriptions(poses)})
+        self.df = pd.DataFrame({"input_poses": poses, "poses": poses, "poses_description": self.parse_descriptions(poses)}, dtype=POSES_STRING_DTYPE)
         return None
 
     def check_prefix(self, prefix: str) -> None:
@@ -781,9 +830,50 @@ class Poses:
         for col in cols:
             if col not in df.columns:
                 raise KeyError(f"Corrupted Format: DataFrame does not contain mandatory Poses column {col}")
-        return df
+        return df.astype({col: POSES_STRING_DTYPE for col in cols})
 
-    def split_multiline_fasta(self, path: str, encoding: str = "UTF-8") -> list[str]:
+    def expand_multiline_fastas(self, poses: list[str]) -> list[str]:
+        """
+        Replaces multiline FASTA files in a list of poses with the paths to their split, single-sequence FASTA files.
+
+        Parameters
+        ----------
+        poses : list[str]
+            A list of pose file paths.
+
+        Returns
+        -------
+        list[str]
+            A new list of pose file paths. Multiline FASTA files are removed and the paths of their split FASTA files are appended to the end of the list.
+
+        Further Details
+        ---------------
+        Every FASTA file is parsed only once. The parsed sequences are passed on to `split_multiline_fasta`, so multiline FASTA files are not read a second time. The input list is not modified.
+
+        Example
+        -------
+        .. code-block:: python
+
+            from poses import Poses
+
+            # Initialize the Poses class with a working directory
+            poses_instance = Poses(work_dir='path/to/work_dir')
+
+            # Expand multiline FASTA files into single-sequence FASTA files
+            poses = poses_instance.expand_multiline_fastas(['path/to/pose1.pdb', 'path/to/multiline.fasta'])
+
+        """
+        out_poses = []
+        split_poses = []
+        for pose in poses:
+            if pose.endswith(".fa") or pose.endswith(".fasta"):
+                if len(fasta_dict := parse_fasta_to_dict(pose)) > 1:
+                    split_poses += self.split_multiline_fasta(pose, fasta_dict=fasta_dict)
+                    continue
+            out_poses.append(pose)
+        return out_poses + split_poses
+
+    def split_multiline_fasta(self, path: str, encoding: str = "UTF-8", fasta_dict: dict[str, str] = None) -> list[str]:
         """
         Splits a multiline FASTA file into individual FASTA files, each containing a single sequence.
 
@@ -793,6 +883,8 @@ class Poses:
             The path to the multiline FASTA file.
         encoding : str, optional
             The encoding of the FASTA file (default is "UTF-8").
+        fasta_dict : dict[str, str], optional
+            The already parsed contents of the FASTA file at <path> ({description: sequence}). If provided, the file is not read again.
 
         Returns
         -------
@@ -826,8 +918,9 @@ class Poses:
         if not hasattr(self, "work_dir"):
             raise AttributeError(f"Set up a work_dir attribute (Poses.set_work_dir()) for your poses class.")
 
-        # read multilie-fasta file and split into individual poses
-        fasta_dict = parse_fasta_to_dict(path, encoding=encoding)
+        # read multilie-fasta file (unless it was already parsed) and split into individual poses
+        if fasta_dict is None:
+            fasta_dict = parse_fasta_to_dict(path, encoding=encoding)
 
         # prepare descriptions in fasta_dict for writing:
         symbols_to_replace = r"[\/\-\:\ \.\|\,]"
@@ -838,25 +931,34 @@ class Poses:
         if not os.path.isdir(output_dir):
             os.makedirs(output_dir, exist_ok=True)
 
-        # write individual poses in fasta directory:
+        # collect individual poses that need to be written into fasta directory:
         out_poses = []
+        fastas_to_write = []
         for description, seq in fasta_dict.items():
             fp = f"{output_dir}/{description}.fa"
             try:
                 # check if files are already there. If contents do not match, write the new fasta-file
-                subfasta_dict = parse_fasta_to_dict(path, encoding=encoding)
-                x_desc = list(subfasta_dict.keys())[0]
-                x_seq = list(subfasta_dict.values())[0]
+                subfasta_dict = parse_fasta_to_dict(fp, encoding=encoding)
+                x_desc, x_seq = next(iter(subfasta_dict.items()))
                 if description != x_desc or seq != x_seq:
                     raise FileNotFoundError
 
-            except FileNotFoundError:
-                with open(fp, 'w', encoding=encoding) as f:
-                    f.write(f">{description}\n{seq}")
+            except (FileNotFoundError, StopIteration):
+                fastas_to_write.append((fp, f">{description}\n{seq}"))
 
             # add fasta path to out_poses:
             out_poses.append(fp)
 
+        # write fasta-files concurrently (independent small-file writes)
+        def write_fasta(fp_content: tuple[str, str]) -> None:
+            fp, content = fp_content
+            with open(fp, 'w', encoding=encoding) as f:
+                f.write(content)
+
+        if fastas_to_write:
+            with ThreadPoolExecutor(max_workers=min(32, len(fastas_to_write))) as executor:
+                list(executor.map(write_fasta, fastas_to_write))
+
         # return list containing paths to .fa files as poses.
         return out_poses
 
@@ -994,16 +1096,19 @@ class Poses:
         - The method automatically appends the correct file extension if it is not already present in the out_path.
         - Ensures that the scores are saved in a format suitable for further analysis and processing.
         """
-        # setup defaults
+        # setup defaults (save method and suffix of the default storage format are cached in set_storage_format())
         out_path = out_path or self.scorefile
-        out_format = out_format or self.storage_format
+        if out_format is None:
+            save_method, format_suffix = self._save_method, self._format_suffix
+        else:
+            save_method, format_suffix = FORMAT_STORAGE_DICT.get(out_format.lower()), f".{out_format}"
 
         # make sure the filename conforms to format
-        if not out_path.endswith(f".{out_format}"):
-            out_path += f".{out_format}"
+        if not out_path.endswith(format_suffix):
+            out_path += format_suffix
 
-        if (save_method_name := FORMAT_STORAGE_DICT.get(out_format.lower())):
-            getattr(self.df, save_method_name)(out_path)
+        if save_method:
+            save_method(self.df, out_path)
 
     def save_poses(self, out_path: str, poses_col: str = "poses", overwrite: bool = True) -> None:
         """
@@ -1047,14 +1152,13 @@ class Poses:
             os.makedirs(out_path, exist_ok=True)
 
         # check if poses are already at out_path, skip if overwrite is set to False
-        if all((os.path.isfile(pose) for pose in new_poses)) and not overwrite:
+        if not overwrite and len(_scan_existing_files(new_poses)) == len(set(new_poses)):
             logging.info(f"Poses already found at {out_path} and overwrite is set to 'False'. Skipping save_poses.")
             return
 
         # save poses
         logging.info(f"Storing poses from column {poses_col} at {out_path}")
-        for pose, new_pose in zip(poses, new_poses):
-            shutil.copy(pose, new_pose)
+        _parallel_copy(zip(poses, new_poses))
 
     def poses_list(self):
         """
@@ -1090,7 +1194,7 @@ class Poses:
         return self.df["poses"].to_list()
 
     ########################################## Operations ###############################################
-    def get_pose(self, pose_description: str) -> Bio.PDB.Structure.Structure:
+    def get_pose(self, pose_description: str) -> "Bio.PDB.Structure.Structure":
         """
         Retrieves a pose structure based on its description.
 
@@ -1131,9 +1235,15 @@ class Poses:
         - Ensures that the returned pose is loaded as a Bio.PDB Structure object for further processing.
 
         """
-        if pose_description not in self.df["poses_description"]:
+        # Bio.PDB is imported lazily, it is expensive to import and not needed for most Poses operations.
+        from protflow.utils.biopython_tools import load_structure_from_pdbfile # pylint: disable=C0415
+        # build description -> pose lookup lazily, it is reset whenever poses.df is reassigned (first pose wins for duplicate descriptions)
+        if self._desc_index is None:
+            unique_poses = self.df.drop_duplicates("poses_description", keep="first")
+            self._desc_index = dict(zip(unique_poses["poses_description"], unique_poses["poses"]))
+        if pose_description not in self._desc_index:
             raise KeyError(f"Pose {pose_description} not Found in Poses DataFrame!")
-        return load_structure_from_pdbfile(self.df[self.df["poses_description"] == pose_description]["poses"].values[0])
+        return load_structure_from_pdbfile(self._desc_index[pose_description])
     
     def reindex_poses(self, prefix:str, remove_layers:int=1, force_reindex:bool=False, sep:str="_", overwrite:bool=False) -> None:
         """
@@ -1195,12 +1305,11 @@ class Poses:
         # drop temporary description column
         self.df.drop("tmp_layer_column", inplace=True, axis=1)
 
-        for old_pose, new_pose in zip(self.df['poses'].to_list(), poses):
-            if overwrite == True or not os.path.isfile(new_pose):
-                shutil.copy(old_pose, new_pose)
+        _parallel_copy(zip(self.df['poses'].to_list(), poses), overwrite=overwrite)
         
-        self.df['poses_description'] = descriptions
-        self.df['poses'] = poses
+        self.df['poses_description'] = pd.array(descriptions, dtype=POSES_STRING_DTYPE)
+        self.df['poses'] = pd.array(poses, dtype=POSES_STRING_DTYPE)
+        self._desc_index = None
 
     def duplicate_poses(self, output_dir:str, n_duplicates:int) -> None:
         """
@@ -1236,35 +1345,36 @@ class Poses:
         - Logs the duplication process and verifies the creation of duplicate files.
 
         """
-        def insert_index_layer(pose, n, sep:str="_") -> str:
-            '''inserts index layer.'''
-            filepath, filename = pose.rsplit("/", maxsplit=1)
-            description, ext = filename.rsplit(".", maxsplit=1)
-            return f"{filepath}/{description}{sep}{str(n).zfill(4)}.{ext}"
-
-        # define outputs:
-        output_files = [f'{output_dir}/{insert_index_layer(pose, n, "_")}' for pose in self.poses_list() for n in range(n_duplicates)]
+        # define outputs (vectorized): every pose is duplicated as {output_dir}/{description}_{index}{ext}
+        os.makedirs(output_dir, exist_ok=True)
+        # precompute path components once per pose, then repeat them for every duplicate
+        descriptions = self.df["poses_description"].to_numpy(dtype=str)
+        description_prefixes = np.char.add(descriptions, "_")
+        location_prefixes = np.char.add(f"{output_dir}/", description_prefixes)
+        ext_suffixes = np.char.add(".", self.df["poses"].str.rsplit(".", n=1).str[-1].to_numpy(dtype=str))
+        indices = np.tile(np.char.zfill(np.arange(n_duplicates).astype(str), 4), len(descriptions))
         output_dict = {
-            "temp_dp_select_col": [file_path.rsplit("/", maxsplit=1)[-1].rsplit("_", maxsplit=1)[0] for file_path in output_files],
-            "temp_dp_description": [file_path.rsplit("/", maxsplit=1)[-1].rsplit(".", maxsplit=1)[0] for file_path in output_files],
-            "temp_dp_location": output_files
+            "temp_dp_select_col": np.repeat(descriptions, n_duplicates),
+            "temp_dp_description": np.char.add(np.repeat(description_prefixes, n_duplicates), indices),
+            "temp_dp_location": np.char.add(np.char.add(np.repeat(location_prefixes, n_duplicates), indices), np.repeat(ext_suffixes, n_duplicates))
         }
 
         # merge DataFrames:
-        self.df.merge(pd.DataFrame(output_dict), left_on="poses_description", right_on="temp_dp_select_col")
+        self.df = self.df.merge(pd.DataFrame(output_dict), left_on="poses_description", right_on="temp_dp_select_col")
 
         # drop select_col and reset index:
         self.df.drop("temp_dp_select_col", inplace=True, axis=1)
         self.df.reset_index(inplace=True, drop=True)
 
-        # check if outputs exist:
-        for pose in self:
-            if not os.path.isfile(pose["temp_dp_location"]):
-                shutil.copy(pose["pose"], pose["temp_dp_location"])
+        # copy poses to their duplicate locations, skip outputs that already exist:
+        logging.info(f"Duplicating poses {n_duplicates} times into {output_dir}")
+        _parallel_copy(zip(self.poses_list(), self.df["temp_dp_location"].to_list()), overwrite=False)
 
         # reset poses and poses_description columns
-        self.df["poses"] = self.df["temp_dp_location"]
-        self.df["poses_description"] = self.df["description"]
+        self.df["poses"] = self.df["temp_dp_location"].astype(POSES_STRING_DTYPE)
+        self.df["poses_description"] = self.df["temp_dp_description"].astype(POSES_STRING_DTYPE)
+        self._desc_index = None
+        self.df.drop(["temp_dp_description", "temp_dp_location"], inplace=True, axis=1)
 
     def reset_poses(self, new_poses_col: str='input_poses', force_reset_df: bool=False):
         """
@@ -1313,12 +1423,7 @@ class Poses:
 
         new_poses = self.df[new_poses_col].to_list()
         # handle multiline .fa inputs for poses!
-        for pose in new_poses:
-            if not pose.endswith(".fa") and not pose.endswith(".fasta"):
-                continue
-            if len(parse_fasta_to_dict(pose)) > 1:
-                new_poses.remove(pose)
-                new_poses += self.split_multiline_fasta(pose)
+        new_poses = self.expand_multiline_fastas(new_poses)
 
         # create unique poses
         new_poses = unique_ordered_list(new_poses)
@@ -1327,11 +1432,12 @@ class Poses:
             logging.warning(f"Different number of new poses ({len(new_poses)}) than number of original poses ({len(self.df.index)})!")
             if force_reset_df:
                 logging.warning(f"Resetting poses dataframe. Be aware of the consequences like possibly reading in false outputs when reusing prefixes!")
-                self.df = pd.DataFrame({"input_poses": new_poses, "poses": new_poses, "poses_description": self.parse_descriptions(new_poses)})
+                self.df = pd.DataFrame({"input_poses": new_poses, "poses": new_poses, "poses_description": self.parse_descriptions(new_poses)}, dtype=POSES_STRING_DTYPE)
             else: raise RuntimeError(f"Could not preserve original dataframe. You can set <force_reset_df> if you want to delete it, but be aware of the consequences like possibly reading in false outputs when reusing prefixes!")
         else:
-            self.df['poses'] = new_poses
-            self.df['poses_description'] = self.parse_descriptions(poses=self.df['poses'].to_list())
+            self.df['poses'] = pd.array(new_poses, dtype=POSES_STRING_DTYPE)
+            self.df['poses_description'] = pd.array(self.parse_descriptions(poses=new_poses), dtype=POSES_STRING_DTYPE)
+            self._desc_index = None
 
     def set_motif(self, motif_col: str) -> None:
         """
@@ -1424,6 +1530,7 @@ class Poses:
         if not self.determine_pose_type() == ['.pdb']:
             raise RuntimeError(f"Poses must be of type .pdb, not {self.determine_pose_type()}")
 
+        from protflow.utils.biopython_tools import load_structure_from_pdbfile, get_sequence_from_pose # pylint: disable=C0415
         os.makedirs(fasta_dir := os.path.join(self.work_dir, f'{prefix}_fasta_location'), exist_ok=True)
         seqs = [get_sequence_from_pose(load_structure_from_pdbfile(path_to_pdb=pose), chain_sep=chain_sep) for pose in self.df['poses'].to_list()]
 
@@ -1436,7 +1543,8 @@ class Poses:
 
         self.df[f'{prefix}_fasta_location'] = fasta_paths
         if update_poses:
-            self.df['poses'] = fasta_paths
+            self.df['poses'] = pd.array(fasta_paths, dtype=POSES_STRING_DTYPE)
+            self._desc_index = None
 
     ########################################## Filtering ###############################################
     def filter_poses_by_rank(self, n: float, score_col: str, remove_layers = None, layer_col = "poses_description", sep = "_", ascending = True, prefix: str = None, plot: bool = False, overwrite: bool = True, storage_format: str = None) -> "Poses":
@@ -1522,8 +1630,7 @@ class Poses:
         # save filtered dataframe if prefix is provided
         if prefix:
             logging.info(f"Saving filter output to {output_name}.")
-            save_method_name = FORMAT_STORAGE_DICT.get(storage_format)
-            getattr(filter_df, save_method_name)(output_name)
+            FORMAT_STORAGE_DICT[storage_format](filter_df, output_name)
 
         # create filter-plots if specified.
         if plot:
@@ -1638,8 +1745,7 @@ class Poses:
         # save filtered dataframe if prefix is provided
         if prefix:
             logging.info(f"Saving filter output to {output_name}.")
-            save_method_name = FORMAT_STORAGE_DICT.get(storage_format)
-            getattr(filter_df, save_method_name)(output_name)
+            FORMAT_STORAGE_DICT[storage_format](filter_df, output_name)
 
         if plot:
             if not prefix:
@@ -2309,11 +2415,60 @@ def get_format(path: str):
         "json": pd.read_json,
         "csv": pd.read_csv,
         "pickle": pd.read_pickle,
-        "feather": pd.read_feather,
-        "parquet": pd.read_parquet
+        "feather": _read_feather,
+        "parquet": _read_parquet
     }
     return loading_function_dict[path.split(".")[-1]]
 
+def scan_dir(directory: str, pattern: str) -> list[str]:
+    '''Returns paths of files in <directory> whose name matches the glob <pattern>. Uses a single os.scandir() pass instead of glob(), falls back to glob() for patterns that span subdirectories.'''
+    if os.sep in pattern or "**" in pattern:
+        return glob(f"{directory}/{pattern}")
+    if not os.path.isdir(directory):
+        return []
+
+    # like glob, only match hidden files if the pattern explicitly starts with a dot
+    match_hidden = pattern.startswith(".")
+    with os.scandir(directory) as entries:
+        return [os.path.join(directory, entry.name) for entry in entries if (match_hidden or not entry.name.startswith(".")) and fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file()]
+
+def _scan_existing_files(paths) -> set[str]:
+    '''Returns the subset of <paths> that exist as files. Every parent directory is listed once with os.scandir() instead of calling os.path.isfile() (one stat() syscall) per path.'''
+    paths_by_dir = {}
+    for path in paths:
+        paths_by_dir.setdefault(os.path.dirname(path), []).append(path)
+
+    existing = set()
+    for directory, dir_paths in paths_by_dir.items():
+        try:
+            with os.scandir(directory or ".") as entries:
+                filenames = {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        existing.update(path for path in dir_paths if os.path.basename(path) in filenames)
+    return existing
+
+def _parallel_copy(pairs, overwrite: bool = True) -> None:
+    '''Copies files given as (source, destination) pairs concurrently using a thread pool. If <overwrite> is False, destinations that already exist are skipped.
+    If several sources share a destination, only the last one is copied (like sequential copying, where the last write wins).'''
+    pairs = list(pairs)
+
+    # deduplicate destinations, so that no two threads write to the same file
+    unique_pairs = list({dst: (src, dst) for src, dst in pairs}.values())
+    if len(unique_pairs) < len(pairs):
+        logging.warning(f"{len(pairs) - len(unique_pairs)} poses share their destination path with another pose. Only the last pose per destination is copied.")
+        pairs = unique_pairs
+    if not overwrite:
+        existing = _scan_existing_files(dst for _, dst in pairs)
+        pairs = [(src, dst) for src, dst in pairs if dst not in existing]
+    if not pairs:
+        return
+
+    # shutil.copy also copies permission bits (like the sequential copy did)
+    with ThreadPoolExecutor(max_workers=min(32, len(pairs))) as executor:
+        # consume results so that exceptions raised in worker threads are propagated
+        list(executor.map(lambda pair: shutil.copy(*pair), pairs))
+
 def load_poses(poses_path: str) -> Poses:
     """
     Loads poses from a specified file and returns a Poses instance.
@@ -13,7 +13,7 @@ It includes classes and utility functions to:
 Dependencies:
 -------------
 
-- builtins: logging, os, re
+- builtins: logging, os, re, functools, itertools
 - pandas
 - protflow.poses: Poses, get_format, FORMAT_STORAGE_DICT
 - protflow.jobstarters: JobStarter
@@ -42,12 +42,15 @@ Version
 import logging
 import os
 import re
+from functools import lru_cache
+from itertools import chain
+from typing import Iterator, Union
 
 # dependencies
 import pandas as pd
 
 # custom
-from protflow.poses import Poses, get_format, FORMAT_STORAGE_DICT
+from protflow.poses import Poses, get_format, FORMAT_STORAGE_DICT, POSES_STRING_DTYPE
 from protflow.jobstarters import JobStarter
 
 class RunnerOutput:
@@ -77,13 +80,21 @@ class RunnerOutput:
         Checks if the input DataFrame has the correct format. It must contain 'description' and 'location' columns.
     return_poses()
         Integrates the output of a runner into a Poses class by merging the formatted runner output into `Poses.df` and returns the updated Poses instance.
+
+    Attributes
+    ----------
+    validate_formatting : bool
+        Class-wide switch (default True). If set to False, `check_data_formatting` skips the row-wise check that 'description'
+        matches the filename in 'location'. Only disable this for trusted runners producing very large score tables.
     """
+    validate_formatting = True
+
     def __init__(self, poses: Poses, results: pd.DataFrame, prefix: str, index_layers: int = 0, index_sep: str = "_"):
         self.results = self.check_data_formatting(results)
 
         # Remove layers if option is set
         if index_layers:
-            self.results["select_col"] = self.results["description"].str.split(index_sep).str[:-1*index_layers].str.join(index_sep)
+            self.results["select_col"] = self.results["description"].str.rsplit(index_sep, n=index_layers).str[0]
         else:
             self.results["select_col"] = self.results["description"]
 
@@ -110,13 +121,15 @@ class RunnerOutput:
         ValueError
             If the input DataFrame does not contain the required columns or if the 'description' column does not match the 'location' column.
         """
-        def extract_description(path):
-            return os.path.splitext(os.path.basename(path))[0]
-
         mandatory_cols = ["description", "location"]
         if any(col not in results.columns for col in mandatory_cols):
             raise ValueError(f"Input Data to RunnerOutput class MUST contain columns 'description' and 'location'.\nDescription should carry the name of the poses, while 'location' should contain the path (+ filename and suffix).")
-        if not (results['description'] == results['location'].apply(extract_description)).all():
+        if not self.validate_formatting:
+            return results
+
+        # description has to be the filename of location without extension (vectorized)
+        location_descriptions = results['location'].str.rsplit("/", n=1).str[-1].str.rsplit(".", n=1).str[0]
+        if not (results['description'].to_numpy(dtype=object) == location_descriptions.to_numpy(dtype=object)).all():
             raise ValueError(f"'description' column does not match 'location' column in runner output dataframe!")
         return results
 
@@ -138,15 +151,26 @@ class RunnerOutput:
         """
         startlen = len(self.results.index)
 
-        # check for duplicate columns
-        if any(x in list(self.poses.df.columns) for x in list(self.results.columns)):
+        # check for duplicate columns (hashed Index intersection instead of rebuilding the column list per column)
+        columns_clash = not self.poses.df.columns.intersection(self.results.columns).empty
+        if columns_clash:
             logging.info(f"WARNING: Merging DataFrames that contain column duplicates. Column duplicates will be renamed!")
 
         # if poses are empty, concatenate DataFrames:
-        if len(self.poses.poses_list()) == 0:
+        if self.poses.df.empty:
             logging.info(f"Poses.df is empty. This means the existing poses.df will be merged with the new results of {self.prefix}")
             merged_df = pd.concat([self.poses.df, self.results])
 
+        # if rows of poses.df and results align 1:1 (common case), concatenate columns positionally instead of merging
+        elif self.rows_aligned():
+            merged_df = pd.concat([self.poses.df.reset_index(drop=True), self.results.reset_index(drop=True)], axis=1)
+
+        # if poses_description is unique and no columns clash, join on prebuilt indexes (keeps order of poses.df like merge)
+        elif self.poses.df["poses_description"].is_unique and not columns_clash:
+            left = self.poses.df.set_index("poses_description", drop=False)
+            right = self.results.set_index(f"{self.prefix}_select_col", drop=False)
+            merged_df = left.join(right, how="inner")
+
         # if poses.df contains scores, merge DataFrames based on poses_description to keep scores continous
         else:
             merged_df = self.poses.df.merge(self.results, left_on="poses_description", right_on=f"{self.prefix}_select_col") # pylint: disable=W0201
@@ -162,14 +186,32 @@ class RunnerOutput:
             raise ValueError(f"Merging DataFrames failed. Some rows in results[new_df_col] were not found in poses.df['poses_description']")
 
         # reset poses and poses_description column
-        merged_df["poses"] = [os.path.abspath(pose) for pose in merged_df[f"{self.prefix}_location"].to_list()]
-        merged_df["poses_description"] = merged_df[f"{self.prefix}_description"]
+        merged_df["poses"] = pd.array([os.path.abspath(pose) for pose in merged_df[f"{self.prefix}_location"].to_list()], dtype=POSES_STRING_DTYPE)
+        merged_df["poses_description"] = merged_df[f"{self.prefix}_description"].astype(POSES_STRING_DTYPE)
 
         # integrate new results into Poses object
         self.poses.df = merged_df
         self.poses.save_scores()
         return self.poses
 
+    def rows_aligned(self) -> bool:
+        """
+        Checks if the rows of `Poses.df` and the runner results align 1:1.
+
+        Rows align if both DataFrames have the same length, share no columns, `Poses.df['poses_description']` is unique
+        and equals the results' select column row by row. In that case merging is equivalent to positional concatenation.
+
+        Returns
+        -------
+        bool
+            True if the results can be concatenated to `Poses.df` column-wise without merging.
+        """
+        descriptions = self.poses.df["poses_description"]
+        select_col = self.results[f"{self.prefix}_select_col"]
+        if len(descriptions) != len(select_col) or self.poses.df.columns.intersection(self.results.columns).size:
+            return False
+        return descriptions.is_unique and bool((descriptions.to_numpy(dtype=object) == select_col.to_numpy(dtype=object)).all())
+
 class Runner:
     """
     Abstract Runner base class
@@ -346,10 +388,11 @@ class Runner:
         # if pose_options is None (not set) return list with empty dicts.
         if pose_options is None:
             # make sure an empty list is passed as pose_options!
-            pose_options = [None for _ in poses]
+            pose_options = [None] * len(poses)
 
-        if len(poses) != len(pose_options) and len(poses) != 0:
-            raise ValueError(f"Arguments <poses> and <pose_options> for RFdiffusion must be of the same length. There might be an error with your pose_options argument!\nlen(poses) = {poses}\nlen(pose_options) = {len(pose_options)}")
+        n_poses = len(poses)
+        if n_poses != len(pose_options) and n_poses != 0:
+            raise ValueError(f"Arguments <poses> and <pose_options> for RFdiffusion must be of the same length. There might be an error with your pose_options argument!\nlen(poses) = {n_poses}\nlen(pose_options) = {len(pose_options)}")
 
         # if pose_options is list and as long as poses, just return list. Has to be list of dicts.
         return pose_options
@@ -423,17 +466,35 @@ class Runner:
         pandas.DataFrame
             The scorefile as a DataFrame if it exists and overwrite is False. None otherwise.
 
+        Notes
+        -----
+        If the scorefile does not exist, but a scorefile of the same name in another storage format does (e.g. a .json
+        scorefile written before the storage format was changed to feather), that scorefile is read and returned. It is not
+        converted into the requested format, so the original scorefile stays the one that later runs read.
+
         Examples
         --------
         >>> runner = MyRunner()
         >>> scores_df = runner.check_for_existing_scorefile("/path/to/scorefile.csv")
         """
+        if overwrite:
+            return None
+
         # check if scorefile exists if overwrite is False
-        if os.path.isfile(scorefile) and not overwrite:
+        if os.path.isfile(scorefile):
             # pick method to import scorefile
             scores = get_format(scorefile)(scorefile)
             return scores
 
+        # fall back to scorefiles of previous runs that were stored in another format
+        scorefile_base = os.path.splitext(scorefile)[0]
+        for storage_format in FORMAT_STORAGE_DICT:
+            if os.path.isfile(other_scorefile := f"{scorefile_base}.{storage_format}"):
+                logging.info(f"Scorefile {scorefile} not found, reading scorefile of previous run at {other_scorefile}.")
+                scores = get_format(other_scorefile)(other_scorefile)
+                return scores
+        return None
+
     def save_runner_scorefile(self, scores: pd.DataFrame, scorefile: str) -> None:
         """
         Saves the runner's scorefile based on the file extension format.
@@ -460,8 +521,8 @@ class Runner:
         storage_method = os.path.splitext(scorefile)[1][1:]
 
         # pick method to save scorefile
-        if (save_method_name := FORMAT_STORAGE_DICT.get(storage_method.lower())):
-            getattr(scores, save_method_name)(scorefile)
+        if (save_method := FORMAT_STORAGE_DICT.get(storage_method.lower())):
+            save_method(scores, scorefile)
         else:
             raise KeyError(f"Could not find method to save scorefile as {storage_method}. Make sure the score file extension is correct!")
 
@@ -486,17 +547,48 @@ def parse_generic_options(options: str, pose_options: str, sep="--") -> tuple[di
     >>> parse_generic_options("--width 800 --height 600", "--color blue --verbose")
     ({'width': '800', 'height': '600', 'color': 'blue'}, ['verbose'])
 
-    This function internally utilizes a helper function `expand_options_flags` to process each input string separately before
-    merging the results, ensuring that pose-specific options and flags are appropriately prioritized and duplicates are removed.
+    Both input strings are walked in a single pass: options are inserted in order, so pose-specific options overwrite generic
+    options, and duplicate flags are removed while keeping the order in which they appear.
     """
-    # parse into options and flags:
-    opts, flags = regex_expand_options_flags(options, sep=sep)
-    pose_opts, pose_flags = regex_expand_options_flags(pose_options, sep=sep)
+    opts = {}
+    flags = {}
 
-    # merge options and pose_options (pose_opts overwrite opts), same for flags
-    opts.update(pose_opts)
-    flags = list(set(flags) | set(pose_flags))
-    return opts, flags
+    # parse options and pose_options in one pass (pose_opts overwrite opts), flags are deduplicated in order of appearance
+    for part in chain(iter_option_parts(options, sep=sep), iter_option_parts(pose_options, sep=sep)):
+        split = OPTION_PART_PATTERN.split(part, maxsplit=1)
+        if len(split) > 1:
+            opts[split[0]] = split[1]
+        else:
+            flags[split[0]] = None
+    return opts, list(flags)
+
+@lru_cache(maxsize=65536)
+def _description_from_str(path: str) -> str:
+    '''Cached filename without extension for a path string.'''
+    return os.path.splitext(os.path.basename(path))[0]
+
+def description_from_path(path: Union[str, os.PathLike]) -> str:
+    """
+    Returns the description of a pose (filename without extension) from its path.
+
+    Results are cached per path string, so repeated lookups (e.g. when writing many commands for the same pose) are cheap.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        Path to the pose file.
+
+    Returns
+    -------
+    str
+        The filename of the pose without directory and extension.
+
+    Examples
+    --------
+    >>> description_from_path("/path/to/pose_0001.pdb")
+    'pose_0001'
+    """
+    return _description_from_str(os.fspath(path))
 
 def col_in_df(df:pd.DataFrame, column:str):
     """
@@ -568,22 +660,88 @@ def expand_options_flags(options_str: str, sep:str="--") -> tuple[dict, set]:
     if not options_str:
         return {}, []
 
-    # split along separator
-    firstsplit = [x.strip() for x in options_str.split(sep) if x]
-
-    # parse into options and flags:
+    # tokenize into (key, value) pairs in a single pass with the precompiled pattern for :sep:
     opts = {}
     flags = []
-    for item in firstsplit:
-        if len((x := item.split())) > 1:
-            opts[x[0]] = " ".join(x[1:])
-        elif len((x := item.split("="))) > 1:
-            opts[x[0]] = " ".join(x[1:])
+    for key, value in options_tokenizer(sep).findall(options_str):
+        if (value := " ".join(value.split())):
+            opts[key] = value
         else:
-            flags.append(x[0])
+            flags.append(key)
 
     return opts, set(flags)
 
+@lru_cache(maxsize=None)
+def options_tokenizer(sep: str = "--") -> re.Pattern:
+    """
+    Returns a compiled pattern that tokenizes an options string into (key, value) tuples.
+
+    The pattern is compiled once per separator and cached. Keys follow the separator, values are everything up to the next
+    separator (after whitespace or '='). Flags are returned with an empty value.
+
+    Parameters
+    ----------
+    sep : str, optional
+        The separator used to distinguish different options and flags (default is "--").
+
+    Returns
+    -------
+    re.Pattern
+        The compiled tokenizer pattern.
+
+    Examples
+    --------
+    >>> options_tokenizer("--").findall("--width 800 --verbose --color=blue")
+    [('width', '800 '), ('verbose', ''), ('color', 'blue')]
+    """
+    sep = re.escape(sep)
+    return re.compile(rf"{sep}\s*((?:(?!{sep})[^\s=])+)(?:\s*=\s*|\s+)?((?:(?!{sep}).)*)", re.DOTALL)
+
+@lru_cache(maxsize=None)
+def options_split_pattern(sep: str = "--") -> re.Pattern:
+    """
+    Returns a compiled pattern that splits a command line at :sep: where :sep: is not inside quotes.
+    :sep: followed by a digit or '.' is not split, so negative values (e.g. '-weight -0.5') stay attached to their option.
+
+    The pattern is compiled once per separator and cached.
+
+    Parameters
+    ----------
+    sep : str, optional
+        The separator used to distinguish different options and flags (default is "--").
+
+    Returns
+    -------
+    re.Pattern
+        The compiled split pattern.
+    """
+    return re.compile(rf"(?<!\S){sep}(?![\d.])(?=(?:[^\"]*\"[^\"]*\")*[^\"]*$)(?=(?:[^\']*\'[^\']*\')*[^\']*$)")
+
+# splits individual option parts at first occurrence of whitespace or equals sign.
+OPTION_PART_PATTERN = re.compile(r"\s+|\s*=\s*")
+
+def iter_option_parts(options_str: str, sep: str = "--") -> Iterator[str]:
+    """
+    Yields the stripped, non-empty parts of a command line split at :sep: where :sep: is not inside quotes.
+
+    Parameters
+    ----------
+    options_str : str
+        The input string containing options and flags. None yields nothing.
+    sep : str, optional
+        The separator used to distinguish different options and flags (default is "--").
+
+    Yields
+    ------
+    str
+        Individual option or flag strings without the separator, e.g. 'width 800' or 'verbose'.
+    """
+    if not options_str:
+        return
+    for part in options_split_pattern(sep).split(options_str):
+        if (part := part.strip()):
+            yield part
+
 def regex_expand_options_flags(options_str: str, sep: str = "--") -> tuple[dict,set]:
     """
     Parses options and flags from an input string using regular expressions.
@@ -619,26 +777,18 @@ def regex_expand_options_flags(options_str: str, sep: str = "--") -> tuple[dict,
     >>> print(flags)
     {'debug'}
     """
-    if options_str is None:
-        return dict(), set()
-    # Regex to split the command line at the separator which is not inside quotes
-    split_pattern = rf"(?<!\S){sep}(?=(?:[^\"]*\"[^\"]*\")*[^\"]*$)(?=(?:[^\']*\'[^\']*\')*[^\']*$)"
-    parts = [x.strip() for x in re.split(split_pattern, options_str) if x]
-
     opts = {}
-    flags = []
-
-    # Setup part_pattern that splits individual parts at first occurrence of whitespace or equals sign.
-    part_pattern = r"\s+|\s*=\s*"
+    flags = set()
 
-    for part in parts:
-        split = re.split(part_pattern, part, maxsplit=1)
+    # split individual parts (split at the separator which is not inside quotes) at first occurrence of whitespace or equals sign.
+    for part in iter_option_parts(options_str, sep=sep):
+        split = OPTION_PART_PATTERN.split(part, maxsplit=1)
         if len(split) > 1:
             opts[split[0]] = split[1]
         else:
-            flags.append(split[0])
+            flags.add(split[0])
 
-    return opts, set(flags)
+    return opts, flags
 
 def options_flags_to_string(options: dict, flags: list, sep="--") -> str:
     """
@@ -674,15 +824,15 @@ def options_flags_to_string(options: dict, flags: list, sep="--") -> str:
     """
     def value_in_quotes(value) -> str:
         '''Makes sure that split commandline options are passed in quotes: --option='quoted list of args' '''
-        if len(str(value).split(" ")) > 1:
-            if not value.startswith("'") and value.endswith("'") or value.startswith('"') and value.endswith('"'):
+        value = str(value)
+        if len(value.split(" ")) > 1:
+            if not ((value.startswith("'") and value.endswith("'")) or (value.startswith('"') and value.endswith('"'))):
                 return f"'{value}'"
         return value
 
-    # assemble options
-    out_str = " " + " ".join([f"{sep}{key}={value_in_quotes(value)}" for key, value in options.items()]) if options else ""
-
-    # if flags are present, assemble those too and return
-    if flags and len(flags) > 1:
-        out_str += f" {sep}" + f" {sep}".join(flags)
-    return out_str
+    # assemble options and flags in one pass
+    out_str = " ".join(chain(
+        (f"{sep}{key}={value_in_quotes(value)}" for key, value in (options or {}).items()),
+        (f"{sep}{flag}" for flag in (flags or []))
+    ))
+    return f" {out_str}" if out_str else ""
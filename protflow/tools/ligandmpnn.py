@@ -501,7 +501,7 @@ class LigandMPNN(Runner):
         """
         # return list of empty strings if pose_opts_col is None.
         if pose_opt_cols is None:
-            return ["" for _ in poses]
+            return [""] * len(poses)
 
         # setup output_dir for .json files
         if any([key in ["bias_AA_per_residue", "omit_AA_per_residue"] for key in pose_opt_cols]):
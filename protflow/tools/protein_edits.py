@@ -434,7 +434,7 @@ class ChainAdder(Runner):
 
         return out_dict
 
-    def parse_motif(self, motif: ResidueSelection|str, pose: pd.Series) -> str:
+    def parse_motif(self, motif: ResidueSelection|str, pose: dict) -> str:
         """
         Set up motif from target_motif input.
 
@@ -443,7 +443,7 @@ class ChainAdder(Runner):
 
         Parameters:
             motif (ResidueSelection | str): The motif to be parsed. It can be either a `ResidueSelection` object or a string.
-            pose (pd.Series): A row from the poses DataFrame that contains information about the protein structure.
+            pose (dict): A row from the poses DataFrame (as yielded by iterating over Poses) that contains information about the protein structure.
 
         Returns:
             str: The motif in string format.
@@ -465,7 +465,7 @@ class ChainAdder(Runner):
                 chain_adder = ChainAdder()
 
                 # Example pose DataFrame row
-                pose = pd.Series({'motif_column': ResidueSelection(...)})
+                pose = {'motif_column': ResidueSelection(...)}
 
                 # Parse a ResidueSelection object
                 motif = ResidueSelection(...)
@@ -709,7 +709,7 @@ def setup_chain_list(chain_arg, poses: Poses) -> list[str]:
         return chain_arg
     raise ValueError(f"Inappropriate value for parameter :chain_arg:. Specify the chain (e.g. 'A'), the column where the chains are listed (e.g. 'chain_col') or give a list of chains the same length as poses.df (e.g. ['A', ...])")
 
-def parse_chain(chain, pose: pd.Series) -> str:
+def parse_chain(chain, pose: dict) -> str:
     '''Sets up chain for add_chains_batch.py'''
     if isinstance(chain, str):
         return chain if len(chain) == 1 else pose[chain]
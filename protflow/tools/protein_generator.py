@@ -68,6 +68,7 @@ Version
 import os
 import logging
 from glob import glob
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 # dependencies
@@ -77,7 +78,7 @@ import pandas as pd
 import protflow.config
 import protflow.jobstarters
 import protflow.tools
-from protflow.runners import Runner, RunnerOutput
+from protflow.runners import Runner, RunnerOutput, description_from_path
 from protflow.poses import Poses
 from protflow.jobstarters import JobStarter
 
@@ -147,6 +148,9 @@ class ProteinGenerator(Runner):
 
     The ProteinGenerator class is intended for researchers and developers who need to perform protein generation as part of their protein design and analysis workflows. It simplifies the process, allowing users to focus on analyzing results and advancing their research.
     """
+    # columns of the scores DataFrame, in the order written by parse_trbfile
+    _TRB_COLS = ["description", "location", "lddt", "perres_lddt", "sequence", "contigs", "inpaint_str", "inpaint_seq"]
+
     def __init__(self, script_path:str=protflow.config.PROTEIN_GENERATOR_SCRIPT_PATH, python_path:str=protflow.config.PROTEIN_GENERATOR_PYTHON_PATH, jobstarter:JobStarter=None) -> None:
         """
         Initialize the ProteinGenerator class with paths to the necessary scripts and Python executable.
@@ -277,8 +281,12 @@ class ProteinGenerator(Runner):
         # parse_options and pose_options:
         pose_options = self.prep_pose_options(poses, pose_options)
 
-        # write protein generator cmds:
-        cmds = [self.write_cmd(pose, output_dir=pdb_dir, options=options, pose_options=pose_opts) for pose, pose_opts in zip(poses, pose_options)]
+        # write protein generator cmds (generator: cmds are streamed into the jobstarter's cmdfile):
+        cmds = (self.write_cmd(pose, output_dir=pdb_dir, options=options, pose_options=pose_opts) for pose, pose_opts in zip(poses.poses_list(), pose_options))
+
+        # only jobstarters that opt in get a lazy generator of cmds
+        if not jobstarter.streams_cmds:
+            cmds = list(cmds)
 
         # run
         jobstarter.start(
@@ -308,7 +316,7 @@ class ProteinGenerator(Runner):
             return pose_options
         elif pose_options is None:
             # make sure an empty list is passed as pose_options!
-            return ["" for x in poses]
+            return [""] * len(poses)
         else:
             raise TypeError(f"Unsupported type for pose_options: {type(pose_options)}. pose_options must be of type [list, None]")
 
@@ -357,7 +365,7 @@ class ProteinGenerator(Runner):
 
         """
         # parse description
-        desc = pose_path.rsplit("/", maxsplit=1)[-1].lsplit(".", maxsplit=1)[0]
+        desc = description_from_path(pose_path)
 
         # parse options
         opts, flags = protflow.runners.parse_generic_options(options, pose_options)
@@ -398,7 +406,7 @@ class ProteinGenerator(Runner):
 
         Further Details:
             - **File Reading:** The method reads all .pdb files from the specified directory. If no .pdb files are found, a FileNotFoundError is raised.
-            - **Data Parsing:** The method parses the corresponding .trb files for each .pdb file, converting them into pandas DataFrames and concatenating them into a single DataFrame.
+            - **Data Parsing:** The method parses the corresponding .trb files for each .pdb file, collecting one row per file and building a single DataFrame from all rows.
             - **Output Organization:** The resulting DataFrame is organized and returned for further analysis, with all scores consolidated from the multiple output files.
 
         """
@@ -407,22 +415,24 @@ class ProteinGenerator(Runner):
         if not pl:
             raise FileNotFoundError(f"No .pdb files were found in the output directory of protein_generator {scores_dir}. protein_generator might have crashed (check output log), or path might be wrong!")
 
-        # parse .trb-files into DataFrames
-        df = pd.concat([self.parse_trbfile(p.replace(".pdb", ".trb")) for p in pl], axis=0).reset_index(drop=True)
+        # parse .trb-files into rows concurrently (reading is I/O-bound) and build the DataFrame once
+        trbs = [p.replace(".pdb", ".trb") for p in pl]
+        with ThreadPoolExecutor(max_workers=min(32, len(trbs))) as executor:
+            df = pd.DataFrame(list(executor.map(self.parse_trbfile, trbs)), columns=self._TRB_COLS)
 
         return df
 
-    def parse_trbfile(self, trbfile: str) -> pd.DataFrame:
+    def parse_trbfile(self, trbfile: str) -> dict:
         """
-        Read a protein_generator output .trb file and parse the scores into a pandas DataFrame.
+        Read a protein_generator output .trb file and parse the scores into a dictionary.
 
-        This method reads the specified .trb file, extracts relevant data, and organizes it into a pandas DataFrame. The data includes scores and various attributes related to the protein generation process.
+        This method reads the specified .trb file, extracts relevant data, and organizes it into a dictionary that represents one row of the scores DataFrame. The data includes scores and various attributes related to the protein generation process.
 
         Parameters:
             trbfile (str): The file path to the .trb file generated by the protein generator.
 
         Returns:
-            pd.DataFrame: A DataFrame containing parsed scores and attributes from the .trb file.
+            dict: A dictionary containing parsed scores and attributes from the .trb file.
 
         Examples:
             Here is an example of how to use the `parse_trbfile` method:
@@ -435,27 +445,30 @@ class ProteinGenerator(Runner):
                 protein_generator = ProteinGenerator()
 
                 # Parse the .trb file
-                df = protein_generator.parse_trbfile(trbfile="output_directory/sample.trb")
+                scores = protein_generator.parse_trbfile(trbfile="output_directory/sample.trb")
 
-                print(df)
+                print(scores)
 
         Further Details:
             - **File Reading:** The method uses numpy to load the .trb file, which is expected to be in a specific format.
             - **Data Extraction:** The method extracts various pieces of information from the .trb file, including description, location, lddt scores, sequence, and contigs.
-            - **Data Formatting:** The extracted data is organized into a dictionary and converted into a pandas DataFrame for ease of use in further analysis.
+            - **Data Formatting:** The extracted data is organized into a dictionary. `collect_scores` builds the scores DataFrame from all parsed rows at once.
 
         """
         trb = np.load(trbfile, allow_pickle=True)
 
+        # per-residue values are kept as numpy arrays, which pyarrow stores natively as list columns in feather/parquet scorefiles
+        perres_lddt = np.asarray(trb["lddt"])
+
         # expand collected data if needed:
         data_dict = {
             "description": trbfile.split("/")[-1].replace(".trb", ""),
             "location": trbfile.replace("trb", "pdb"),
-            "lddt": [sum(trb["lddt"]) / len(trb["lddt"])],
-            "perres_lddt": [trb["lddt"]],
+            "lddt": float(perres_lddt.mean()),
+            "perres_lddt": perres_lddt,
             "sequence": trb["args"]["sequence"],
             "contigs": trb["args"]["contigs"],
-            "inpaint_str": [trb["inpaint_str"].numpy().tolist()],
-            "inpaint_seq": [trb["inpaint_seq"].numpy().tolist()]
+            "inpaint_str": trb["inpaint_str"].numpy(),
+            "inpaint_seq": trb["inpaint_seq"].numpy()
         }
-        return pd.DataFrame(data_dict)
+        return data_dict
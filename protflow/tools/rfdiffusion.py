@@ -70,6 +70,7 @@ import logging
 from glob import glob
 import re
 from typing import Any
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
 # dependencies
@@ -80,9 +81,12 @@ from protflow.poses import Poses
 from protflow.jobstarters import JobStarter
 import protflow.config
 from protflow.residues import ResidueSelection
-from protflow.runners import Runner, col_in_df
+from protflow.runners import Runner, col_in_df, description_from_path
 from protflow.runners import RunnerOutput
 
+# splits rfdiffusion options at whitespace outside of single quotes
+_OPTS_SPLIT_RE = re.compile(r"\s+(?=(?:[^']*'[^']*')*[^']*$)")
+
 
 class RFdiffusion(Runner):
     """
@@ -306,10 +310,12 @@ class RFdiffusion(Runner):
         # in case overwrite is set, overwrite previous results.
         if overwrite or not os.path.isfile(scorefile):
             if os.path.isfile(scorefile): os.remove(scorefile)
-            for pdb in glob(f"{pdb_dir}/*pdb"):
-                if os.path.isfile(trb := pdb.replace(".pdb", ".trb")):
-                    os.remove(trb)
-                    os.remove(pdb)
+            with os.scandir(pdb_dir) as entries:
+                output_files = {entry.name for entry in entries}
+            for pdb in output_files:
+                if pdb.endswith(".pdb") and (trb := pdb[:-4] + ".trb") in output_files:
+                    os.remove(os.path.join(pdb_dir, trb))
+                    os.remove(os.path.join(pdb_dir, pdb))
 
         # parse options and pose_options:
         pose_options = self.prep_pose_options(poses, pose_options)
@@ -320,15 +326,20 @@ class RFdiffusion(Runner):
             cmds = [self.write_cmd(pose=None, options=options, pose_opts=pose_option, output_dir=pdb_dir, num_diffusions=num_diffusions) for pose_option in pose_options]
         elif len(poses) == 0 and not pose_options:
             # if neither poses nor pose_options exist: write n=max_cores commands with generic output name.
-            cmds = [self.write_cmd(pose=None, options=options, pose_opts="inference.output_prefix=" + os.path.join(pdb_dir, f"diff_{str(i+1).zfill(4)}"), output_dir=pdb_dir, num_diffusions=num_diffusions) for i in range(jobstarter.max_cores)]
+            output_prefix_opt = "inference.output_prefix=" + os.path.join(pdb_dir, "diff_")
+            cmds = [self.write_cmd(pose=None, options=options, pose_opts=output_prefix_opt + str(i+1).zfill(4), output_dir=pdb_dir, num_diffusions=num_diffusions) for i in range(jobstarter.max_cores)]
         elif multiplex_poses:
             # create multiple copies (specified by multiplex variable) of poses to fully utilize parallel computing:
             poses.duplicate_poses(f"{poses.work_dir}/{prefix}_input_pdbs/", jobstarter.max_cores)
             self.index_layers += 1
-            cmds = [self.write_cmd(pose, options, pose_opts, output_dir=pdb_dir, num_diffusions=num_diffusions) for pose, pose_opts in zip(poses.poses_list(), pose_options)]
+            cmds = (self.write_cmd(pose, options, pose_opts, output_dir=pdb_dir, num_diffusions=num_diffusions) for pose, pose_opts in zip(poses.poses_list(), pose_options))
         else:
-            # write rfdiffusion cmds
-            cmds = [self.write_cmd(pose, options, pose_opts, output_dir=pdb_dir, num_diffusions=num_diffusions) for pose, pose_opts in zip(poses.poses_list(), pose_options)]
+            # write rfdiffusion cmds (generator: cmds are streamed into the jobstarter's cmdfile)
+            cmds = (self.write_cmd(pose, options, pose_opts, output_dir=pdb_dir, num_diffusions=num_diffusions) for pose, pose_opts in zip(poses.poses_list(), pose_options))
+
+        # only jobstarters that opt in get a lazy generator of cmds
+        if not jobstarter.streams_cmds:
+            cmds = list(cmds)
 
         # diffuse
         jobstarter.start(
@@ -339,7 +350,7 @@ class RFdiffusion(Runner):
         )
 
         # collect RFdiffusion outputs
-        scores = self.collect_scores(work_dir=work_dir, rename_pdbs=True).reset_index(drop=True)
+        scores = self.collect_scores(work_dir=work_dir, rename_pdbs=True)
         logging.info(f"Saving scores of {self} at {scorefile}")
         self.save_runner_scorefile(scores=scores, scorefile=scorefile)
 
@@ -422,10 +433,6 @@ class RFdiffusion(Runner):
 
         This method is designed to create a fully-formed command string for running RFdiffusion, making it easier to execute diffusion processes with the desired parameters.
         """
-        # parse description:
-        if pose:
-            desc = os.path.splitext(os.path.basename(pose))[0]
-
         # parse options:
         start_opts = self.parse_rfdiffusion_opts(options, pose_opts)
 
@@ -434,7 +441,8 @@ class RFdiffusion(Runner):
         if "inference.num_designs" not in start_opts:
             start_opts["inference.num_designs"] = num_diffusions
         if "inference.output_prefix" not in start_opts:
-            start_opts["inference.output_prefix"] = os.path.join(output_dir, desc)
+            # description is only needed (and only parsed) when no output_prefix was passed
+            start_opts["inference.output_prefix"] = os.path.join(output_dir, description_from_path(pose))
 
         opts_str = " ".join([f"{k}={v}" for k, v in start_opts.items()])
 
@@ -471,12 +479,7 @@ class RFdiffusion(Runner):
 
         This method is designed to create a consolidated dictionary of options for the RFdiffusion script, facilitating the construction of command strings with the appropriate parameters.
         """
-        def re_split_rfdiffusion_opts(command) -> list:
-            if command is None:
-                return []
-            return re.split(r"\s+(?=(?:[^']*'[^']*')*[^']*$)", command)
-
-        splitstr = [x for x in re_split_rfdiffusion_opts(options) + re_split_rfdiffusion_opts(pose_options) if x] # adding pose_opts after options makes sure that pose_opts overwrites options!
+        splitstr = [x for x in _OPTS_SPLIT_RE.split(options or "") + _OPTS_SPLIT_RE.split(pose_options or "") if x] # adding pose_opts after options makes sure that pose_opts overwrites options!
         return {x.split("=")[0]: "=".join(x.split("=")[1:]) for x in splitstr}
 
     def collect_scores(self, work_dir: str, rename_pdbs: bool = True) -> pd.DataFrame:
@@ -516,40 +519,48 @@ class RFdiffusion(Runner):
         pl = glob(f"{pdb_dir}/*.pdb")
         if not pl: raise FileNotFoundError(f"No .pdb files were found in the diffusion output direcotry {pdb_dir}. RFDiffusion might have crashed (check inpainting error-log), or the path might be wrong!")
 
-        # collect rfdiffusion scores into a DataFrame:
-        scores = []
-        for pdb in pl:
-            if os.path.isfile(trb := pdb.replace(".pdb", ".trb")):
-                scores.append(parse_diffusion_trbfile(trb))
-        scores = pd.concat(scores)
+        # collect rfdiffusion scores into rows concurrently (reading is I/O-bound) and build the DataFrame once:
+        trbs = [trb for pdb in pl if os.path.isfile(trb := pdb.replace(".pdb", ".trb"))]
+        with ThreadPoolExecutor(max_workers=min(32, max(len(trbs), 1))) as executor:
+            scores = pd.DataFrame(list(executor.map(parse_diffusion_trbfile, trbs)))
 
         # rename pdbs if option is set:
         if rename_pdbs is True:
-            scores.loc[:, "new_description"] = ["_".join(desc.split("_")[:-1]) + "_" + str(int(desc.split("_")[-1]) + 1).zfill(4) for desc in scores["description"]]
-            scores.loc[:, "new_loc"] = [loc.replace(old_desc, new_desc) for loc, old_desc, new_desc in zip(list(scores["location"]), list(scores["description"]), list(scores["new_description"]))]
+            desc_parts = scores["description"].str.rsplit("_", n=1)
+            new_idx = (desc_parts.str[-1].astype(int) + 1).astype(str).str.zfill(4)
+            scores["new_description"] = desc_parts.str[0] + "_" + new_idx
+            scores["new_loc"] = pdb_dir + "/" + scores["new_description"] + ".pdb"
+
+            # bucket output files by description (name without extension, descriptions can contain dots) with a single directory scan
+            files_by_desc = {}
+            with os.scandir(pdb_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or "." not in entry.name:
+                        continue
+                    files_by_desc.setdefault(os.path.splitext(entry.name)[0], []).append(entry.path)
 
             # rename all diffusion outputfiles according to new indeces:
-            _ = [[os.rename(f, f.replace(old_desc, new_desc)) for f in glob(f"{pdb_dir}/{old_desc}.*")] for old_desc, new_desc in zip(list(scores["description"]), list(scores["new_description"]))]
+            for old_desc, new_desc in zip(scores["description"].to_list(), scores["new_description"].to_list()):
+                for f in files_by_desc.get(old_desc, []):
+                    os.rename(f, f.replace(old_desc, new_desc))
 
             # Collect information of path to .pdb files into DataFrame under 'location' column
             scores = scores.drop(columns=["location"]).rename(columns={"new_loc": "location"})
             scores = scores.drop(columns=["description"]).rename(columns={"new_description": "description"})
 
-        scores.reset_index(drop=True, inplace=True)
-
         return scores
 
-def parse_diffusion_trbfile(path: str) -> pd.DataFrame:
+def parse_diffusion_trbfile(path: str) -> dict:
     """
-    Parse a .trb file from RFdiffusion and extract relevant scores into a pandas DataFrame.
+    Parse a .trb file from RFdiffusion and extract relevant scores into a dictionary.
 
-    This method reads a .trb file generated by RFdiffusion, extracts relevant scoring information, and organizes it into a DataFrame. The extracted information includes pLDDT scores, residue indices, and metadata.
+    This method reads a .trb file generated by RFdiffusion, extracts relevant scoring information, and organizes it into a dictionary that represents one row of the scores DataFrame. The extracted information includes pLDDT scores, residue indices, and metadata.
 
     Parameters:
         path (str): The path to the .trb file.
 
     Returns:
-        pd.DataFrame: A DataFrame containing the extracted scores and metadata from the .trb file.
+        dict: A dictionary containing the extracted scores and metadata from the .trb file.
 
     Raises:
         ValueError: If the provided file path does not end with .trb.
@@ -560,13 +571,13 @@ def parse_diffusion_trbfile(path: str) -> pd.DataFrame:
         .. code-block:: python
 
             path = "/path/to/output.trb"
-            scores_df = rfdiffusion.parse_diffusion_trbfile(path)
-            # scores_df will contain the extracted scores and metadata
+            scores = rfdiffusion.parse_diffusion_trbfile(path)
+            # scores will contain the extracted scores and metadata
 
     Further Details:
         - **File Reading:** The method uses numpy to load the .trb file and allows for pickled objects.
         - **Score Extraction:** Extracted scores include mean pLDDT, per-residue pLDDT, and other relevant metrics.
-        - **Metadata Collection:** Metadata such as file location, description, and input PDB are included in the DataFrame.
+        - **Metadata Collection:** Metadata such as file location, description, and input PDB are included in the dictionary.
 
     This method is designed to parse and organize the data from RFdiffusion .trb files, making it easier to analyze the results.
     """
@@ -574,23 +585,38 @@ def parse_diffusion_trbfile(path: str) -> pd.DataFrame:
     if path.endswith(".trb"): data_dict = np.load(path, allow_pickle=True)
     else: raise ValueError(f"only .trb-files can be passed into parse_inpainting_trbfile. <trbfile>: {path}")
 
-    # calc mean_plddt:
+    # calc mean_plddt (copy the last frame, a view would keep the whole plddt trajectory alive in the scores DataFrame):
     sd = {}
-    last_plddts = data_dict["plddt"][-1]
-    sd["plddt"] = [sum(last_plddts) / len(last_plddts)]
-    sd["perres_plddt"] = [last_plddts]
+    last_plddts = np.array(data_dict["plddt"][-1])
+    sd["plddt"] = float(last_plddts.mean())
+    sd["perres_plddt"] = last_plddts
 
     # instantiate scoresdict and start collecting:
-    scoreterms = ["con_hal_pdb_idx", "con_ref_pdb_idx", "sampled_mask"]
-    for st in scoreterms:
-        sd[st] = [data_dict[st]]
+    # (chain, residue) tuples are stored as [chain, residue] string pairs: pyarrow lists hold a single value type, so feather/parquet scorefiles can store and read them back (see get_residue_mapping)
+    sd["con_hal_pdb_idx"] = pdb_idx_to_pairs(data_dict["con_hal_pdb_idx"])
+    sd["con_ref_pdb_idx"] = pdb_idx_to_pairs(data_dict["con_ref_pdb_idx"])
+    sd["sampled_mask"] = data_dict["sampled_mask"]
 
     # collect metadata
     sd["location"] = path.replace(".trb", ".pdb")
     sd["description"] = path.split("/")[-1].replace(".trb", "")
     sd["input_pdb"] = data_dict["config"]["inference"]["input_pdb"]
 
-    return pd.DataFrame(sd)
+    return sd
+
+def pdb_idx_to_pairs(pdb_idx: list) -> list[list[str]]:
+    """
+    Convert RFdiffusion (chain, residue_id) tuples into [chain, residue_id] string pairs.
+
+    Lists of mixed str/int tuples cannot be stored by pyarrow. String pairs are stored natively in feather/parquet scorefiles and read back unchanged. `get_residue_mapping` converts them back into (chain, int) tuples.
+
+    Parameters:
+        pdb_idx (list): List of (chain, residue_id) tuples, e.g. con_ref_pdb_idx of an RFdiffusion .trb file.
+
+    Returns:
+        list[list[str]]: List of [chain, residue_id] pairs, e.g. [["A", "10"], ["A", "20"]].
+    """
+    return [[str(chain), str(res_id)] for chain, res_id in pdb_idx]
 
 def prep_motif_input(motif: Any, df: pd.DataFrame) -> list[str]:
     """
@@ -688,8 +714,8 @@ def get_residue_mapping(con_ref_idx: list, con_hal_idx: list) -> dict:
     This method creates a mapping dictionary that maps old residue indices (from con_ref_idx) to new residue indices (from con_hal_idx).
 
     Parameters:
-        con_ref_idx (list): A list of reference residue indices from the RFdiffusion outputs, where each element is a tuple of (chain, residue_id).
-        con_hal_idx (list): A list of halogenated residue indices from the RFdiffusion outputs, where each element is a tuple of (chain, residue_id).
+        con_ref_idx (list): A list of reference residue indices from the RFdiffusion outputs, where each element is a (chain, residue_id) pair. Pairs can be tuples, lists or arrays and residue_id can be int or str (as stored by `pdb_idx_to_pairs`).
+        con_hal_idx (list): A list of halogenated residue indices from the RFdiffusion outputs, where each element is a (chain, residue_id) pair like in con_ref_idx.
 
     Returns:
         dict: A dictionary where keys are tuples of (chain, residue_id) from con_ref_idx and values are tuples of (chain, residue_id) from con_hal_idx.
@@ -710,4 +736,5 @@ def get_residue_mapping(con_ref_idx: list, con_hal_idx: list) -> dict:
 
     This method is designed to facilitate the creation of residue mappings for updating motifs or other residue-based selections.
     """
-    return {(chain, int(res_id)): hal for (chain, res_id), hal in zip(con_ref_idx, con_hal_idx)}
+    # pairs can be tuples, [chain, residue_id] lists or arrays (as read back from scorefiles): normalize to (chain, int) tuples
+    return {(str(chain), int(res_id)): (str(hal_chain), int(hal_res_id)) for (chain, res_id), (hal_chain, hal_res_id) in zip(con_ref_idx, con_hal_idx)}
@@ -67,10 +67,12 @@ Version
 """
 # general imports
 import os
+import json
 import time
 import logging
 from glob import glob
-import shutil
+from fnmatch import fnmatch
+from concurrent.futures import ThreadPoolExecutor
 
 # dependencies
 import pandas as pd
@@ -250,7 +252,7 @@ class Rosetta(Runner):
         # otherwise raise error for not properly setting up the rosetta script paths.
         raise ValueError(f"No usable Rosetta executable provided. Easiest fix: provide full path to executable with parameter :rosetta_application: in the Rosetta.run() method.")
 
-    def run(self, poses: Poses, prefix: str, jobstarter: JobStarter = None, rosetta_application: str = None, nstruct: int = 1, options: str = None, pose_options: list|str = None, overwrite: bool = False, fail_on_missing_output_poses: bool = False) -> Poses:
+    def run(self, poses: Poses, prefix: str, jobstarter: JobStarter = None, rosetta_application: str = None, nstruct: int = 1, options: str = None, pose_options: list|str = None, overwrite: bool = False, fail_on_missing_output_poses: bool = False, nstruct_mode: str = "parallel") -> Poses:
         """
         Execute the Rosetta process with given poses and jobstarter configuration.
 
@@ -265,6 +267,7 @@ class Rosetta(Runner):
             options (str, optional): Additional options for the Rosetta application. Defaults to None.
             pose_options (list[str] | str, optional): A list of pose-specific options for the Rosetta application. Defaults to None.
             overwrite (bool, optional): If True, overwrite existing output files. Defaults to False.
+            nstruct_mode (str, optional): "parallel" starts one Rosetta process per output structure (nstruct processes per pose). "batch" starts one process per pose that generates all nstruct structures with Rosetta's -nstruct flag, paying Rosetta's startup (database loading) only once per pose. Defaults to "parallel".
 
         Returns:
             RunnerOutput: An instance of the RunnerOutput class, containing the processed poses and results of the Rosetta process.
@@ -340,11 +343,19 @@ class Rosetta(Runner):
         if not os.path.isdir(work_dir): os.makedirs(work_dir, exist_ok=True)
         pose_options = self.prep_pose_options(poses, pose_options)
 
-        # write rosettascripts cmds:
-        cmds = []
-        for pose, pose_opts in zip(poses.df['poses'].to_list(), pose_options):
-            for i in range(1, nstruct+1):
-                cmds.append(self.write_cmd(pose_path=pose, rosetta_application=rosetta_exec, output_dir=work_dir, i=i, overwrite=overwrite, options=options, pose_options=pose_opts))
+        # parse generic options once, only pose_options are merged in per pose
+        self._check_options(options)
+        base_opts, base_flags = protflow.runners.parse_generic_options(options, None, sep="-")
+
+        # write rosettascripts cmds (options are formatted once per pose, not once per nstruct index):
+        pose_paths = poses.poses_list()
+        options_strs = [self._format_options(base_opts, base_flags, pose_options=pose_opts, overwrite=overwrite) for pose_opts in pose_options]
+        if nstruct_mode == "batch":
+            cmds = [self._assemble_cmd(rosetta_application=rosetta_exec, pose_path=pose, output_dir=work_dir, options_str=options_str, nstruct=nstruct) for pose, options_str in zip(pose_paths, options_strs)]
+        elif nstruct_mode == "parallel":
+            cmds = [self._assemble_cmd(rosetta_application=rosetta_exec, pose_path=pose, output_dir=work_dir, options_str=options_str, i=i) for pose, options_str in zip(pose_paths, options_strs) for i in range(1, nstruct+1)]
+        else:
+            raise ValueError(f"Parameter :nstruct_mode: must be one of ['parallel', 'batch']. Provided: {nstruct_mode}")
 
         # run
         jobstarter.start(
@@ -354,8 +365,8 @@ class Rosetta(Runner):
             output_path=f"{work_dir}/"
         )
 
-        # collect scores and rename pdbs.
-        time.sleep(10) # Rosetta does not have time to write the last score into the scorefile otherwise?
+        # Rosetta might still be flushing the last scores into the scorefiles when the jobs return (every command writes one scorefile).
+        wait_for_scorefiles(work_dir, n_expected=len(cmds))
 
         # collect scores
         scores = collect_scores(work_dir=work_dir)
@@ -371,7 +382,7 @@ class Rosetta(Runner):
 
         return RunnerOutput(poses=poses, results=scores, prefix=prefix, index_layers=self.index_layers).return_poses()
 
-    def write_cmd(self, rosetta_application: str, pose_path: str, output_dir: str, i: int, overwrite: bool = False, options: str = None, pose_options: str = None):
+    def write_cmd(self, rosetta_application: str, pose_path: str, output_dir: str, i: int, overwrite: bool = False, options: str = None, pose_options: str = None, nstruct: int = None):
         """
         Writes the command to run a Rosetta application.
 
@@ -385,6 +396,7 @@ class Rosetta(Runner):
             overwrite (bool, optional): If True, overwrite existing output files. Defaults to False.
             options (str, optional): Additional options for the Rosetta application. Defaults to None.
             pose_options (str, optional): Pose-specific options for the Rosetta application. Defaults to None.
+            nstruct (int, optional): If set, the command generates nstruct structures in a single Rosetta process (-nstruct) and :i: is ignored. Outputs are prefixed with 'r_' and carry Rosetta's own structure index. Defaults to None.
 
         Returns:
             str: The command string to execute the Rosetta application.
@@ -422,24 +434,37 @@ class Rosetta(Runner):
 
         This method is designed to facilitate the construction of command strings for running Rosetta applications, making it easier for researchers and developers to execute and manage Rosetta simulations within the ProtFlow framework.
         """
-        # parse options
-        opts, flags = protflow.runners.parse_generic_options(options, pose_options, sep="-")
-        opts = " ".join([f"-{key}={value}" for key, value in opts.items()])
-        flags = " -" + " -".join(flags) if flags else ""
+        self._check_options(options)
+        base_opts, base_flags = protflow.runners.parse_generic_options(options, None, sep="-")
+        options_str = self._format_options(base_opts, base_flags, pose_options=pose_options, overwrite=overwrite)
+        return self._assemble_cmd(rosetta_application=rosetta_application, pose_path=pose_path, output_dir=output_dir, options_str=options_str, i=i, nstruct=nstruct)
 
-        # check if interfering options were set
+    def _check_options(self, options: str) -> None:
+        '''Raises KeyError if :options: contain arguments that are set by the Rosetta runner itself.'''
         forbidden_options = ['-out:path:all', '-in:file:s', '-out:prefix', '-out:file:scorefile', '-out:file:scorefile_format', ' -s ', '-scorefile_format']
-        if (options and any(opt in options for opt in forbidden_options)) or (pose_options and any(pose_opt in pose_options for pose_opt in forbidden_options)):
+        if options and any(opt in options for opt in forbidden_options):
             raise KeyError(f"options and pose_options must not contain any of {forbidden_options}")
 
-        # parse options
-        opts, flags = protflow.runners.parse_generic_options(options, pose_options)
-        opts = " ".join([f"-{key}={value}" for key, value in opts.items()]) if opts else ""
+    def _format_options(self, base_opts: dict, base_flags: list, pose_options: str = None, overwrite: bool = False) -> str:
+        '''Merges :pose_options: into already parsed generic options (pose_options take precedence) and formats them into the options part of a Rosetta command.'''
+        opts, flags = base_opts, base_flags
+        if pose_options:
+            self._check_options(pose_options)
+            pose_opts, pose_flags = protflow.runners.parse_generic_options(None, pose_options, sep="-")
+            opts = {**base_opts, **pose_opts}
+            flags = base_flags + [flag for flag in pose_flags if flag not in base_flags]
+
+        opts = " ".join([f"-{key}={value}" for key, value in opts.items()])
         flags = " -" + " -".join(flags) if flags else ""
         overwrite = " -overwrite" if overwrite else ""
-
-        # compile command
-        run_string = f"{rosetta_application} -out:path:all {output_dir} -in:file:s {pose_path} -out:prefix r{str(i).zfill(4)}_ -out:file:scorefile r{str(i).zfill(4)}_{os.path.splitext(os.path.basename(pose_path))[0]}_score.json -out:file:scorefile_format json {opts} {flags} {overwrite}"
+        return f"{opts} {flags} {overwrite}"
+
+    def _assemble_cmd(self, rosetta_application: str, pose_path: str, output_dir: str, options_str: str, i: int = None, nstruct: int = None) -> str:
+        '''Assembles a Rosetta command from the formatted options of a pose (see write_cmd).'''
+        # compile command (batched commands let Rosetta index the structures: r_<description>_<nstruct index>)
+        out_prefix = "r_" if nstruct else f"r{str(i).zfill(4)}_"
+        nstruct_opt = f" -nstruct {nstruct}" if nstruct else ""
+        run_string = f"{rosetta_application} -out:path:all {output_dir} -in:file:s {pose_path} -out:prefix {out_prefix}{nstruct_opt} -out:file:scorefile {out_prefix}{os.path.splitext(os.path.basename(pose_path))[0]}_score.json -out:file:scorefile_format json {options_str}"
         
         logging.debug(f"Run command: {run_string}")
 
@@ -477,42 +502,109 @@ def collect_scores(work_dir: str) -> pd.DataFrame:
 
     This function is designed to streamline the process of collecting and organizing Rosetta output data, making it easier for researchers and developers to analyze the results of Rosetta simulations within the ProtFlow framework.
     """
+    # Rosetta writes one JSON record per line into its scorefiles: parse them directly instead of one pd.read_json per file
     scorefiles = glob(os.path.join(work_dir, "r*_*_score.json"))
     scores_l = []
     for scorefile in scorefiles:
-        scores_l.append(pd.read_json(scorefile, typ='series'))
-    scores_df = pd.DataFrame(scores_l).reset_index(drop=True).rename(columns={"decoy": "raw_description"})
-    scores_df.loc[:, "description"] = scores_df["raw_description"].str.split("_").str[1:-1].str.join("_") + "_" + scores_df["raw_description"].str.split("_").str[0].str.replace("r", "")
+        with open(scorefile, 'r', encoding="UTF-8") as f:
+            scores_l.extend(json.loads(line) for line in f if line.strip())
+    scores_df = pd.DataFrame(scores_l).rename(columns={"decoy": "raw_description"})
+    # raw_description is r{index}_{description}_{rosetta_index}: reindex to {description}_{index} in a single regex pass
+    # (batched runs write r_{description}_{rosetta_index}, there the rosetta_index is the index)
+    raw_descriptions = scores_df["raw_description"]
+    if raw_descriptions.str.match(r"r\d{4}_").all():
+        # fixed-width prefix (parallel runs below 10000 structures): slice index and description instead of matching the full regex
+        scores_df["description"] = raw_descriptions.str.slice(6).str.rsplit("_", n=1).str[0].str.cat(raw_descriptions.str.slice(1, 5), sep="_")
+    else:
+        raw_parts = raw_descriptions.str.extract(r"^r(\d*)_(.*)_([^_]+)$")
+        index = raw_parts[0].where(raw_parts[0] != "", raw_parts[2])
+        scores_df["description"] = raw_parts[1].str.cat(index, sep="_")
 
     # wait for all Rosetta output files to appear in the output directory (for some reason, they are sometimes not there after the runs completed.)
-    while len(glob(f"{work_dir}/r*.pdb")) < len(scores_df):
+    while count_rosetta_output_pdbs(work_dir) < len(scores_df):
         time.sleep(1)
 
+    # index Rosetta output .pdb files once (rename happens within work_dir, so os.rename is a single syscall)
+    with os.scandir(work_dir) as entries:
+        raw_pdbfiles = {entry.name for entry in entries if entry.name.startswith("r") and entry.name.endswith(".pdb")}
+
     # rename .pdb files in work_dir to the reindexed names.
-    names_dict = scores_df[["raw_description", "description"]].to_dict()
     logging.info(f"Renaming and reindexing {len(scores_df)} Rosetta output .pdb files")
-    for oldname, newname in zip(names_dict["raw_description"].values(), names_dict["description"].values()):
-        shutil.move(f"{work_dir}/{oldname}.pdb", (nf := f"{work_dir}/{newname}.pdb"))
-        if not os.path.isfile(nf):
-            print(f"WARNING: Could not rename file {oldname} to {nf}\n Retrying renaming.")
-            shutil.move(f"{work_dir}/{oldname}.pdb", (nf := f"{work_dir}/{newname}.pdb"))
+    prefix = os.path.join(work_dir, "")
+    rename_pairs = [(f"{prefix}{oldname}.pdb", f"{prefix}{newname}.pdb") for oldname, newname in scores_df[["raw_description", "description"]].itertuples(index=False, name=None)]
+    raw_pdbfiles.difference_update(f"{oldname}.pdb" for oldname in scores_df["raw_description"])
+
+    # renames are independent and I/O bound (slow on network filesystems), so they are run on a thread pool
+    with ThreadPoolExecutor(max_workers=min(32, max(len(rename_pairs), 1))) as executor:
+        failed_pairs = [pair for pair, error in zip(rename_pairs, executor.map(_try_rename, rename_pairs)) if error]
+
+    # retry failed renames sequentially, this time raising on error
+    for oldpath, newpath in failed_pairs:
+        logging.warning(f"Retrying rename of {oldpath} to {newpath}")
+        os.rename(oldpath, newpath)
 
     # Collect information of path to .pdb files into dataframe under "location" column
-    scores_df.loc[:, "location"] = work_dir + "/" + scores_df["description"] + ".pdb"
+    scores_df.loc[:, "location"] = prefix + scores_df["description"] + ".pdb"
 
     # safetycheck rename all remaining files with r*.pdb into proper filename:
-    if (remaining_r_pdbfiles := glob(f"{work_dir}/r*.pdb")):
-        for pdb_path in remaining_r_pdbfiles:
-            pdb_path = pdb_path.split("/")[-1]
-            idx = pdb_path.split("_")[0].replace("r", "")
-            new_name = "_".join(pdb_path.split("_")[1:-1]).replace(".pdb", "") + "_" + idx + ".pdb"
-            shutil.move(f"{work_dir}/{pdb_path}", f"{work_dir}/{new_name}")
+    for pdb_path in raw_pdbfiles:
+        parts = pdb_path.removesuffix(".pdb").split("_")
+        idx = parts[0].replace("r", "") or parts[-1]
+        new_name = "_".join(parts[1:-1]) + "_" + idx + ".pdb"
+        os.rename(prefix + pdb_path, prefix + new_name)
 
     # reset index and write scores to file
     scores_df.reset_index(drop="True", inplace=True)
 
     return scores_df
 
+def wait_for_scorefiles(work_dir: str, n_expected: int = 0, stable_ms: int = 200, timeout: float = 60) -> None:
+    """
+    Waits until the expected Rosetta scorefiles in work_dir exist and stop changing.
+
+    The sizes of all `r*_*_score.json` files are sampled every `stable_ms` milliseconds. The function returns as soon as at
+    least `n_expected` scorefiles exist and two consecutive samples are identical, or logs a warning once `timeout` seconds
+    have passed.
+
+    Parameters:
+        work_dir (str): The directory where Rosetta output files are stored.
+        n_expected (int, optional): Number of scorefiles that the Rosetta jobs write (one per command). Defaults to 0.
+        stable_ms (int, optional): Interval between two samples of the scorefile sizes in milliseconds. Defaults to 200.
+        timeout (float, optional): Maximum time to wait in seconds. Defaults to 60.
+    """
+    deadline = time.monotonic() + timeout
+    previous_sizes = None
+    while time.monotonic() < deadline:
+        with os.scandir(work_dir) as entries:
+            sizes = {entry.name: entry.stat().st_size for entry in entries if fnmatch(entry.name, "r*_*_score.json")}
+        if len(sizes) >= n_expected and sizes == previous_sizes:
+            return
+        previous_sizes = sizes
+        time.sleep(stable_ms / 1000)
+    logging.warning(f"Rosetta scorefiles in {work_dir} were still missing or changing after {timeout} seconds (found {len(previous_sizes or {})} of {n_expected} expected). Collecting scores anyway.")
+
+def count_rosetta_output_pdbs(work_dir: str) -> int:
+    """
+    Counts the (not yet renamed) Rosetta output .pdb files (r*.pdb) in work_dir with a single directory scan.
+
+    Parameters:
+        work_dir (str): The directory where Rosetta output files are stored.
+
+    Returns:
+        int: Number of files in work_dir matching r*.pdb.
+    """
+    with os.scandir(work_dir) as entries:
+        return sum(1 for entry in entries if entry.name.startswith("r") and entry.name.endswith(".pdb"))
+
+def _try_rename(pair: tuple[str, str]) -> OSError:
+    '''Renames pair[0] to pair[1]. Logs and returns the error instead of raising, returns None on success.'''
+    try:
+        os.rename(*pair)
+    except OSError as e:
+        logging.warning(f"Could not rename {pair[0]} to {pair[1]}: {e}")
+        return e
+    return None
+
 def clean_rosetta_scorefile(path_to_file: str, out_path: str) -> str:
     """
     Cleans a faulty Rosetta scorefile.
@@ -548,15 +640,21 @@ def clean_rosetta_scorefile(path_to_file: str, out_path: str) -> str:
 
     This function is useful for ensuring that Rosetta scorefiles are properly formatted and free of inconsistencies, facilitating accurate data analysis.
     """
-    # read in file line-by-line:
-    with open(path_to_file, 'r', encoding="UTF-8") as f:
-        scores = [line.split() for line in list(f.readlines()[1:])]
-
-    # if any line has a different number of scores than the header (columns), that line will be removed.
-    scores_cleaned = [line for line in scores if len(line) == len(scores[0])]
-    logging.warning(f"{len(scores) - len(scores_cleaned)} scores were removed from Rosetta scorefile at {path_to_file}")
-
-    # write cleaned scores to file:
-    with open(out_path, 'w', encoding="UTF-8") as f:
-        f.write("\n".join([",".join(line) for line in scores_cleaned]))
+    # stream file line-by-line, skipping the SEQUENCE line and using the header to set the number of columns:
+    n_removed = 0
+    with open(path_to_file, 'r', encoding="UTF-8") as fin, open(out_path, 'w', encoding="UTF-8") as fout:
+        next(fin, None)
+        header = next(fin, "").split()
+        fout.write(",".join(header))
+
+        # if any line has a different number of scores than the header (columns), that line will be removed.
+        for line in fin:
+            parts = line.split()
+            if len(parts) != len(header):
+                n_removed += 1
+                continue
+            fout.write("\n")
+            fout.write(",".join(parts))
+
+    logging.warning(f"{n_removed} scores were removed from Rosetta scorefile at {path_to_file}")
     return out_path
@@ -62,6 +62,7 @@ Markus Braun, Adrian Tripp
 import copy
 import os
 from typing import Union
+import numpy as np
 import pandas as pd
 
 # dependencies
@@ -122,6 +123,52 @@ def load_structure_from_pdbfile(path_to_pdb: str, all_models = False, model: int
     else:
         return pdb_parser.get_structure(handle, path_to_pdb)[model]
 
+def load_ca_coords(path_to_pdb: str) -> np.ndarray:
+    """
+    Load the coordinates of all CA atoms of the first model in a PDB file without building a BioPython structure.
+
+    This is a fast path for workflows that only need CA coordinates (e.g. radius of gyration). The file is read line by
+    line and only the coordinate columns of CA atoms are parsed, so no Structure/Model/Chain/Residue/Atom objects are created.
+    Like BioPython's PDBParser, ATOM and HETATM records are read and for alternate locations the CA with the highest occupancy
+    is kept (the first one on ties).
+
+    Parameters:
+    path_to_pdb (str): Path to the PDB file to be parsed.
+
+    Returns:
+    np.ndarray: Array of shape (N, 3) with the coordinates of the N CA atoms in the first model.
+
+    Raises:
+    FileNotFoundError: If the specified PDB file does not exist.
+    ValueError: If the file is not a .pdb file.
+
+    Example:
+    >>> ca_coords = load_ca_coords("example.pdb")
+    >>> ca_coords.shape
+    (120, 3)
+    """
+    # sanity
+    if not os.path.isfile(path_to_pdb):
+        raise FileNotFoundError(f"PDB file {path_to_pdb} not found!")
+    if not path_to_pdb.endswith(".pdb"):
+        raise ValueError(f"File must be .pdb file. File: {path_to_pdb}")
+
+    # one CA per residue (chain, resseq + icode, hetero resname): {residue: (occupancy, coords)}, dicts keep residue order
+    ca_atoms = {}
+    with open(path_to_pdb, 'r', encoding="UTF-8") as f:
+        for line in f:
+            if line.startswith(("ATOM", "HETATM")):
+                if line[12:16].strip() == "CA":
+                    residue = (line[21], line[22:27], line[17:20] if line.startswith("HETATM") else "")
+                    occupancy = float(line[54:60]) if line[54:60].strip() else 0.0
+                    # like BioPython's DisorderedAtom: select a later altloc only if its occupancy is strictly higher
+                    if residue not in ca_atoms or occupancy > ca_atoms[residue][0]:
+                        ca_atoms[residue] = (occupancy, (float(line[30:38]), float(line[38:46]), float(line[46:54])))
+            elif line.startswith("ENDMDL"):
+                # only first model
+                break
+    return np.array([coords for _, coords in ca_atoms.values()], dtype=np.float32).reshape(-1, 3)
+
 def save_structure_to_pdbfile(pose: Structure, save_path: str) -> None:
     """
     Save a BioPython structure object to a PDB file.
@@ -300,18 +347,19 @@ def get_atoms(structure: Structure, atoms: list[str], chains: list[str] = None,
     # Gather all chains from the structure
     chains = [structure[chain] for chain in chains] if chains else [chain for chain in structure]
 
-    # loop over chains and residues and gather all atoms.
+    # only select amino acids in each chain, unless het atoms are requested
+    residues = (res for chain in chains for res in chain if include_het_atoms or res.id[0] == " ")
+
+    # loop over residues once and gather all atoms.
     atms_list = []
-    for chain in chains:
-        # Only select amino acids in each chain:
-        if include_het_atoms == False: residues = [res for res in chain if res.id[0] == " "]
-        else: residues = [res for res in chain]
+    if atoms:
+        want = tuple(atoms)
+        for residue in residues:
+            atms_list.extend(residue[atom] for atom in want)
+    else:
+        # sort atoms by their atom name, ordering of atoms within residues differs depending on the software creating the .pdb file
         for residue in residues:
-            # sort atoms by their atom name, ordering of atoms within residues differs depending on the software creating the .pdb file
-            if atoms:
-                atms_list += [residue[atom] for atom in atoms]
-            else:
-                atms_list += sorted(list(residue.get_atoms()), key=lambda a: a.id)
+            atms_list.extend(sorted(residue.get_atoms(), key=lambda a: a.id))
 
     return atms_list
 
@@ -367,27 +415,22 @@ def get_atoms_of_motif(pose: Structure, motif: ResidueSelection, atoms: list[str
     if excluded_atoms is None:
         excluded_atoms = ["H", "NE1", "OXT"] # exclude hydrogens and terminal N and O because they lead to crashes when calculating all-atom RMSD
 
+    excluded = frozenset(excluded_atoms)
+
     # empty list to collect atoms into:
     out_atoms = []
     for chain, res_id in motif:
-        if atoms:
-            if include_het_atoms == False: res_atoms = [pose[chain][(" ", res_id, " ")][atom] for atom in atoms]
-            else:
-                for res in pose[chain].get_residues():
-                    if res.id[1] == res_id: res_atoms = [res[atm] for atm in atoms]; break
+        # resolve residue once per motif position
+        if include_het_atoms:
+            res = next((r for r in pose[chain].get_residues() if r.id[1] == res_id), None)
+            if res is None:
+                raise KeyError(f"Residue {res_id} not found in chain {chain}.")
         else:
-            if include_het_atoms == False: res_atoms = sorted(list(pose[chain][(" ", res_id, " ")].get_atoms()), key=lambda a: a.id)
-            else:
-                for res in pose[chain].get_residues():
-                    if res.id[1] == res_id: res_atoms = sorted(list(res.get_atoms()), key=lambda a: a.id); break
-
-        # filter out forbidden atoms
-        res_atoms = [atom for atom in res_atoms if atom.name not in excluded_atoms]
-        if exclude_hydrogens:
-            res_atoms = [atom for atom in res_atoms if atom.element != "H"]
-
-        # add atoms into aggregation list:
-        out_atoms += res_atoms
+            res = pose[chain][(" ", res_id, " ")]
+        res_atoms = [res[atom] for atom in atoms] if atoms else sorted(res.get_atoms(), key=lambda a: a.id)
+
+        # filter out forbidden atoms (and hydrogens) in a single pass
+        out_atoms += [atom for atom in res_atoms if atom.name not in excluded and not (exclude_hydrogens and atom.element == "H")]
     return out_atoms
 
 def add_chain(target: Structure, reference: Structure, copy_chain: str, overwrite: bool = True) -> Structure:
@@ -460,11 +503,55 @@ def get_sequence_from_pose(pose: Structure, chain_sep:str=":") -> str:
     >>> print(sequence)
     'MSTHRRRPQEAAGRVNRLPGTPLARAKYFYPKPGERKVEQTPWFAWDVTAGNEYEDTIEFRLEAEGKVGEVVEREDPDNGRGNFARFSLGLYGSKTQYRLPFTVEEVFHDLESVTQKDGFWNCTAFRTVQRLPRTRVAAELNPRAKAAASAVFTFQSQDVDAVANAVEACFAGFYEVVGVFVSNAVDGSVAGAQNFSQFCVGFRGGPRMLRQNRAPATFASAGNHPAKVLAACGLRYAA...
     '''
-    # setup PPBuilder:
-    ppb = Bio.PDB.PPBuilder()
+    # single unbroken chains do not need the peptide builder
+    seq = _single_chain_sequence(pose)
+    if seq is not None:
+        return seq
 
     # collect sequence
-    return chain_sep.join([str(x.get_sequence()) for x in ppb.build_peptides(pose)])
+    return chain_sep.join([str(x.get_sequence()) for x in _get_ppbuilder().build_peptides(pose)])
+
+_PPB = None
+
+def _get_ppbuilder() -> Bio.PDB.PPBuilder:
+    '''Returns module-level PPBuilder, created on first use.'''
+    global _PPB
+    if _PPB is None:
+        _PPB = Bio.PDB.PPBuilder()
+    return _PPB
+
+def _single_chain_sequence(pose: Structure) -> str:
+    '''Returns the sequence of a pose that holds one unbroken chain of standard amino acids, or None if PPBuilder has to split the pose.'''
+    level = pose.get_level()
+    if level == "S":
+        chains = pose[0].get_list()
+    elif level == "M":
+        chains = pose.get_list()
+    elif level == "C":
+        chains = [pose]
+    else:
+        return None
+    # PPBuilder builds no peptide from a single residue, so those poses are left to it as well
+    if len(chains) != 1 or len(chains[0]) < 2:
+        return None
+
+    # every residue must be a standard amino acid with ordered backbone C and N atoms
+    residues = chains[0].get_list()
+    letters = []
+    for res in residues:
+        letter = _STANDARD_AA_3TO1.get(res.get_resname())
+        if letter is None or not (res.has_id("C") and res.has_id("N")) or res["C"].is_disordered() or res["N"].is_disordered():
+            return None
+        letters.append(letter)
+
+    # check peptide bonds between consecutive residues (same criterion as PPBuilder)
+    c_coords = np.array([res["C"].coord for res in residues[:-1]])
+    n_coords = np.array([res["N"].coord for res in residues[1:]])
+    if not np.all(np.linalg.norm(c_coords - n_coords, axis=1) < _get_ppbuilder().radius):
+        return None
+    return "".join(letters)
+
+_STANDARD_AA_3TO1 = {three: one for three, one in Bio.PDB.Polypeptide.protein_letters_3to1.items() if three in Bio.PDB.Polypeptide.standard_aa_names}
 
 def renumber_pdb_by_residue_mapping(pose_path: str, residue_mapping: dict, out_pdb_path: str = None, keep_chain: str = "") -> str:
     """
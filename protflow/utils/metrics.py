@@ -81,9 +81,13 @@ from Bio.PDB.Structure import Structure
 import pandas as pd
 
 # customs
-from protflow.utils.biopython_tools import load_structure_from_pdbfile
+from protflow.utils.biopython_tools import load_structure_from_pdbfile, load_ca_coords
 from protflow.utils.utils import vdw_radii
 
+def _seq_to_array(seq: str) -> np.ndarray:
+    '''Converts a sequence into one uint32 code point per character (fixed-width, so positions stay aligned) in a single pass without a per-character Python loop.'''
+    return np.frombuffer(seq.encode("utf-32-le"), dtype=np.uint32)
+
 def get_mutations_list(wt: str, variant:str) -> None:
     '''Not implemented.'''
     raise NotImplementedError
@@ -116,16 +120,11 @@ def count_mutations(wt: str, variant:str) -> tuple[int, list[str]]:
     if len(wt) != len(variant):
         raise ValueError("Sequences must be of the same length")
 
-    mutations = []
-    mutation_count = 0
-
-    for i, (a, b) in enumerate(zip(wt, variant)):
-        if a != b:
-            mutation_count += 1
-            mutation = f"{a}{i+1}{b}"
-            mutations.append(mutation)
+    # compare sequences in numpy and only format the (few) mutated positions in python
+    mutated_idx = np.flatnonzero(_seq_to_array(wt) != _seq_to_array(variant)).tolist()
+    mutations = [f"{wt[i]}{i+1}{variant[i]}" for i in mutated_idx]
 
-    return mutation_count, mutations
+    return len(mutations), mutations
 
 def get_mutation_indeces(wt: str, variant:str) -> list[int]:
     '''
@@ -155,9 +154,9 @@ def get_mutation_indeces(wt: str, variant:str) -> list[int]:
     # sanity
     if len(wt) != len(variant): raise ValueError(f"wt and variant must be of same length! lengths: wt: {len(wt)} variant: {len(variant)}")
 
-    # convert sequences into arrays
-    wt_arr = np.array(list(wt))
-    variant_arr = np.array(list(variant))
+    # view sequences as arrays (no intermediate list of characters)
+    wt_arr = _seq_to_array(wt)
+    variant_arr = _seq_to_array(variant)
 
     # Find indices where mutations occur (1-based index)
     return list(np.where(wt_arr != variant_arr)[0] + 1)
@@ -187,7 +186,7 @@ def calc_rog_of_pdb(pdb_path: str, min_dist: float = 0) -> float:
     >>> rog = calc_rog_of_pdb("example.pdb")
     >>> print(rog)
     """
-    return calc_rog(load_structure_from_pdbfile(pdb_path), min_dist=min_dist)
+    return calc_rog_from_coords(load_ca_coords(pdb_path), min_dist=min_dist)
 
 def calc_rog(pose: Structure, min_dist: float = 0) -> float:
     """
@@ -222,15 +221,39 @@ def calc_rog(pose: Structure, min_dist: float = 0) -> float:
     >>> rog = calc_rog(structure)
     >>> print(rog)
     """
-    # get CA coordinates and calculate centroid
-    ca_coords = np.array([atom.get_coord() for atom in pose.get_atoms() if atom.id == "CA"])
-    centroid = np.mean(ca_coords, axis=0)
+    # get CA coordinates (one lookup per residue instead of iterating over all atoms)
+    ca_coords = np.array([residue["CA"].coord for residue in pose.get_residues() if "CA" in residue])
+    return calc_rog_from_coords(ca_coords, min_dist=min_dist)
+
+def calc_rog_from_coords(ca_coords: np.ndarray, min_dist: float = 0) -> float:
+    """
+    Calculate the radius of gyration from an array of alpha carbon coordinates.
+
+    Parameters
+    ----------
+    ca_coords : np.ndarray
+        Array of shape (N, 3) containing the coordinates of the alpha carbons.
+    min_dist : float, optional
+        Minimum distance to consider between atoms, by default 0.
+
+    Returns
+    -------
+    float
+        The calculated radius of gyration.
 
-    # calculate average distance of CA atoms to centroid
-    dgram = np.maximum(min_dist, np.linalg.norm(ca_coords - centroid, axis=-1))
+    Example
+    -------
+    >>> from metrics import calc_rog_from_coords
+    >>> from protflow.utils.biopython_tools import load_ca_coords
+    >>> rog = calc_rog_from_coords(load_ca_coords("example.pdb"))
+    >>> print(rog)
+    """
+    # calculate distance of CA atoms to centroid (clipped at min_dist, in place)
+    dgram = np.linalg.norm(ca_coords - ca_coords.mean(axis=0), axis=-1)
+    np.maximum(dgram, min_dist, out=dgram)
 
     # take root over squared sum of distances and return (rog):
-    return np.sqrt(np.sum(dgram**2) / ca_coords.shape[0])
+    return np.sqrt(dgram.dot(dgram) / ca_coords.shape[0])
 
 def calc_sequence_identity(seq1: str, seq2: str) -> float:
     """
@@ -265,7 +288,7 @@ def calc_sequence_identity(seq1: str, seq2: str) -> float:
     """
     if len(seq1) != len(seq2):
         raise ValueError(f"Sequences must be of the same length. Length of seq1: {len(seq1)}, length of seq2: {len(seq2)}")
-    matching = sum(1 for a, b in zip(seq1, seq2) if a == b)
+    matching = int(np.count_nonzero(_seq_to_array(seq1) == _seq_to_array(seq2)))
     return matching / len(seq1)
 
 def all_against_all_sequence_identity(input_seqs: list[str]) -> list:
@@ -296,15 +319,23 @@ def all_against_all_sequence_identity(input_seqs: list[str]) -> list:
     aa_mapping = {'A': 0, 'C': 1, 'D': 2, 'E': 3, 'F': 4, 'G': 5, 'H': 6, 'I': 7, 'K': 8, 'L': 9, 'M': 10, 'N': 11, 'P': 12, 'Q': 13, 'R': 14, 'S': 15, 'T': 16, 'V': 17, 'W': 18, 'Y': 19}
     mapped_seqs = np.array([[aa_mapping[s] for s in seq] for seq in input_seqs])
 
-    # create all-against-all array and calculate sequence identity
-    expanded_a = mapped_seqs[:, np.newaxis]
-    expanded_b = mapped_seqs[np.newaxis, :]
-    similarity_matrix = np.mean(expanded_a == expanded_b, axis=2)
+    # one-hot encode sequences (N, 20 * L): the dot product of two encoded sequences is their number of identical positions
+    n_seqs, seq_len = mapped_seqs.shape
+    one_hot = np.zeros((n_seqs, seq_len * len(aa_mapping)), dtype=np.float32)
+    one_hot[np.arange(n_seqs)[:, np.newaxis], np.arange(seq_len) * len(aa_mapping) + mapped_seqs] = 1
+
+    # calculate all-against-all identities as matrix products in blocks of rows (avoids an N x N x L comparison array)
+    block_size = 1024
+    max_identities = np.empty(n_seqs)
+    for start in range(0, n_seqs, block_size):
+        stop = min(start + block_size, n_seqs)
+        matches = one_hot[start:stop] @ one_hot.T
 
-    # convert diagonal from 1.0 to -inf
-    np.fill_diagonal(similarity_matrix, -np.inf)
+        # convert diagonal (self-identity) to -inf
+        matches[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+        max_identities[start:stop] = matches.max(axis=1).astype(np.float64) / seq_len
 
-    return list(np.max(similarity_matrix, axis=1))
+    return list(max_identities)
 
 def entropy(prob_distribution: np.array) -> float:
     """
@@ -331,13 +362,15 @@ def entropy(prob_distribution: np.array) -> float:
     >>> print(ent)
     # Output: 1.1567796494470395
     """
-    # Filter out zero probabilities to avoid log(0)
-    prob_distribution = prob_distribution[prob_distribution > 0]
+    prob_distribution = np.asarray(prob_distribution, dtype=np.float64).ravel()
 
-    # Compute entropy
-    H = np.sum(prob_distribution * np.log2(prob_distribution)) # pylint: disable=C0103
+    # zero out non-positive probabilities and take log2 only where probabilities are positive (avoids log(0))
+    positive = prob_distribution > 0
+    prob_distribution = np.where(positive, prob_distribution, 0.0)
+    log_probs = np.log2(prob_distribution, out=np.zeros_like(prob_distribution), where=positive)
 
-    return -H
+    # Compute entropy
+    return -float(np.dot(prob_distribution, log_probs))
 
 def calc_sc_tm(input_df: pd.DataFrame, name: str, ref_col: str, tm_col: str) -> pd.DataFrame:
     """
@@ -16,6 +16,7 @@ setup(
         'pandas',
         'numpy',
         'Bio',
+        'pyarrow',
         'matplotlib',
     ],
     # Other metadata
@@ -0,0 +1,60 @@
+'''Tests that RFdiffusion residue mappings survive saving and reloading of scorefiles.
+
+Run with: python -m unittest tests/test_rfdiffusion_scorefile.py
+'''
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from protflow.poses import FORMAT_STORAGE_DICT, get_format
+from protflow.residues import ResidueSelection
+from protflow.tools.rfdiffusion import parse_diffusion_trbfile, get_residue_mapping, update_motif_res_mapping
+
+class TestRFdiffusionScorefile(unittest.TestCase):
+    '''Saves parsed .trb scores in every arrow-backed format (and json), reloads them and remaps motifs.'''
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        trb_path = os.path.join(self.tmp_dir.name, "pose_0.trb")
+        trb = {
+            "plddt": [np.array([0.5, 0.7, 0.9])],
+            "con_ref_pdb_idx": [("A", 10), ("A", 20)],
+            "con_hal_pdb_idx": [("A", 1), ("A", 2)],
+            "sampled_mask": ["A10-10/5/A20-20"],
+            "config": {"inference": {"input_pdb": "input.pdb"}}
+        }
+        with open(trb_path, "wb") as f:
+            pickle.dump(trb, f)
+        self.scores = pd.DataFrame([parse_diffusion_trbfile(trb_path)])
+        self.expected_mapping = {("A", 10): ("A", 1), ("A", 20): ("A", 2)}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_residue_mapping_after_reload(self):
+        for storage_format in ["feather", "parquet", "json"]:
+            with self.subTest(storage_format=storage_format):
+                scorefile = os.path.join(self.tmp_dir.name, f"scores.{storage_format}")
+                FORMAT_STORAGE_DICT[storage_format](self.scores, scorefile)
+                loaded = get_format(scorefile)(scorefile)
+
+                # residue pairs are stored natively by pyarrow, not through the pickle fallback
+                if storage_format in ["feather", "parquet"]:
+                    with open(scorefile, "rb") as f:
+                        self.assertNotEqual(f.read(1), b"\x80")
+
+                mapping = get_residue_mapping(loaded["con_ref_pdb_idx"].iloc[0], loaded["con_hal_pdb_idx"].iloc[0])
+                self.assertEqual(mapping, self.expected_mapping)
+
+                motifs = update_motif_res_mapping([ResidueSelection(["A10", "A20"])], loaded["con_ref_pdb_idx"].to_list(), loaded["con_hal_pdb_idx"].to_list())
+                self.assertEqual(motifs[0].residues, (("A", 1), ("A", 2)))
+
+    def test_residue_mapping_from_trb_tuples(self):
+        mapping = get_residue_mapping([("A", 10), ("A", 20)], [("A", 1), ("A", 2)])
+        self.assertEqual(mapping, self.expected_mapping)
+
+if __name__ == "__main__":
+    unittest.main()